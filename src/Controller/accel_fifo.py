@@ -0,0 +1,146 @@
+from array import array
+from adafruit_bus_device.i2c_device import I2CDevice
+
+ADDRESS = 0x53
+
+# registers
+_THRESH_TAP = 0x1D
+_DUR = 0x21
+_LATENT = 0x22
+_WINDOW = 0x23
+_TAP_AXES = 0x2A
+_BW_RATE = 0x2C
+_POWER_CTL = 0x2D
+_INT_ENABLE = 0x2E
+_INT_SOURCE = 0x30
+_DATA_FORMAT = 0x31
+_DATAX0 = 0x32
+_FIFO_CTL = 0x38
+_FIFO_STATUS = 0x39
+
+FIFO_SIZE = 32
+
+# full resolution keeps 4 mg per count at every range
+MG_PER_COUNT = 4
+
+# output data rate in Hz -> BW_RATE code
+RATES = {12: 0x07, 25: 0x08, 50: 0x09, 100: 0x0A, 200: 0x0B, 400: 0x0C, 800: 0x0D}
+
+# INT_SOURCE / INT_ENABLE bits
+SINGLE_TAP = 0x40
+DOUBLE_TAP = 0x20
+
+_FULL_RES = 0x08
+_MEASURE = 0x08
+_BYPASS = 0x00
+_STREAM = 0x80
+
+
+class FifoAccelerometer:
+    """
+    ADXL345 with its 32 entry FIFO in stream mode, so samples pile up on the
+    chip at the data rate and get drained in blocks instead of polled one by one.
+    read_block() fills samples (x, y, z triples, in counts of MG_PER_COUNT mg)
+    and returns how many it read.
+    
+    The chip pops a FIFO entry each time the data registers are read, and a
+    longer read doesn't roll over into the next entry, so a block is one 6 byte
+    read per sample. They all happen under one bus lock into buffers made here.
+    """
+    
+    def __init__(self, i2c, *, address=ADDRESS, rate=100):
+        self._device = I2CDevice(i2c, address)
+        self._cmd = bytearray(2)
+        self._reg = bytearray(1)
+        self._byte = bytearray(1)
+        self._raw = bytearray(6)
+        self.samples = array("h", [0] * (3 * FIFO_SIZE))
+        self.count = 0
+        self.taps_enabled = False
+        
+        # blocks that came back full, meaning samples were probably lost
+        self.full_blocks = 0
+        
+        self._write(_POWER_CTL, 0)
+        self.set_rate(rate)
+        self._write(_DATA_FORMAT, _FULL_RES)
+        self._write(_FIFO_CTL, _STREAM)
+        self._write(_POWER_CTL, _MEASURE)
+    
+    def _write(self, reg, value):
+        cmd = self._cmd
+        cmd[0] = reg
+        cmd[1] = value
+        with self._device as dev:
+            dev.write(cmd)
+    
+    def _read_byte(self, reg):
+        self._reg[0] = reg
+        with self._device as dev:
+            dev.write_then_readinto(self._reg, self._byte)
+        return self._byte[0]
+    
+    def set_rate(self, hz):
+        """set the output data rate, one of RATES"""
+        if hz not in RATES:
+            raise ValueError(f"unsupported ADXL345 rate: {hz}")
+        self.rate = hz
+        self._write(_BW_RATE, RATES[hz])
+    
+    def enable_taps(self, *, threshold_mg=3000, duration_ms=15, latent_ms=80, window_ms=250):
+        """
+        turn on the chip's single and double tap detection on all three axes.
+        taps show up as SINGLE_TAP / DOUBLE_TAP in interrupt_source(), which
+        works by polling even with the INT pins unconnected.
+        """
+        # register scales from the datasheet: 62.5 mg, 625 us, 1.25 ms, 1.25 ms per LSB
+        self._write(_THRESH_TAP, min(255, threshold_mg * 2 // 125))
+        self._write(_DUR, min(255, duration_ms * 8 // 5))
+        self._write(_LATENT, min(255, latent_ms * 4 // 5))
+        self._write(_WINDOW, min(255, window_ms * 4 // 5))
+        self._write(_TAP_AXES, 0x07)
+        self._write(_INT_ENABLE, SINGLE_TAP | DOUBLE_TAP)
+        self.taps_enabled = True
+    
+    def clear(self):
+        """empty the FIFO by dropping to bypass mode and back, two writes instead of a drain"""
+        self._write(_FIFO_CTL, _BYPASS)
+        self._write(_FIFO_CTL, _STREAM)
+        self.count = 0
+    
+    def available(self):
+        """samples waiting in the FIFO"""
+        return self._read_byte(_FIFO_STATUS) & 0x3F
+    
+    def interrupt_source(self):
+        """read (and clear) INT_SOURCE"""
+        return self._read_byte(_INT_SOURCE)
+    
+    def read_block(self):
+        """drain the FIFO into samples, returns how many samples were read"""
+        n = self.available()
+        if n == 0:
+            self.count = 0
+            return 0
+        if n >= FIFO_SIZE:
+            # the FIFO holds 32 plus the one sitting in the data registers
+            n = FIFO_SIZE
+            self.full_blocks += 1
+        
+        samples = self.samples
+        raw = self._raw
+        reg = self._reg
+        reg[0] = _DATAX0
+        with self._device as dev:
+            j = 0
+            for _ in range(n):
+                dev.write_then_readinto(reg, raw)
+                for k in range(3):
+                    v = raw[2 * k] | (raw[2 * k + 1] << 8)
+                    if v & 0x8000:
+                        v -= 0x10000
+                    samples[j + k] = v
+                j += 3
+        
+        self.count = n
+        return n
@@ -1,6 +1,8 @@
 import time
+import asyncio
 import board
 import pwmio
+from clock import ticks_ms, ticks_diff, ticks_add
 
 BUZZER_PIN = board.D3
 VOLUME = 5000
@@ -9,71 +11,151 @@ buzzer = pwmio.PWMOut(BUZZER_PIN, frequency=1000, duty_cycle=0, variable_frequen
 
 
 def tone(freq, duration=0.1):
+    """play one blocking tone, use the sequencer for anything during gameplay"""
     buzzer.frequency = freq
     buzzer.duty_cycle = VOLUME
     time.sleep(duration)
     buzzer.duty_cycle = 0
 
 
+# sound effects as (frequency hz, duration ms) notes, frequency 0 is a rest
+
+# correct timing
+SUCCESS = ((523, 50), (659, 80))
+
+# lost a life
+FAIL = ((400, 100), (300, 100), (200, 150))
+
+# wrong timing
+WRONG = ((250, 200),)
+
+# win the game
+VICTORY = ((392, 80), (494, 80), (523, 80), (659, 150))
+
+# game over
+GAME_OVER = ((494, 100), (440, 100), (392, 100), (330, 200))
+
+# completed a level
+LEVEL_UP = ((440, 60), (494, 60), (587, 100))
+
+# intro music
+INTRO = (
+    (784, 150), (784, 80), (880, 150), (784, 150),   # G5 G5 A5 G5
+    (784, 150), (784, 80), (988, 150), (784, 150),   # G5 G5 B5 G5
+    (784, 150), (784, 80), (880, 150), (784, 150),   # G5 G5 A5 G5
+    (698, 150), (698, 80), (659, 150), (587, 250),   # F5 F5 E5 D5
+)
+
+
+class ToneSequencer:
+    """
+    Plays a note list on the buzzer without blocking.
+    play() starts a sequence, tick() moves to the next note once the current one
+    is over, so it has to be called often (the audio task in tasks.py does).
+    """
+    
+    def __init__(self, pwm, volume=VOLUME):
+        self._pwm = pwm
+        self.volume = volume
+        self._notes = ()
+        self._index = 0
+        self._note_end = 0
+    
+    @property
+    def playing(self):
+        return self._index < len(self._notes)
+    
+    def play(self, notes):
+        """start a sequence, replacing anything still playing"""
+        self._notes = notes
+        self._index = 0
+        self._start_note(ticks_ms())
+    
+    def stop(self):
+        """silence the buzzer and drop the rest of the sequence"""
+        self._notes = ()
+        self._index = 0
+        self._pwm.duty_cycle = 0
+    
+    def tick(self):
+        """advance to the next note when the current one is due to end"""
+        if self._index >= len(self._notes):
+            return
+        now = ticks_ms()
+        if ticks_diff(now, self._note_end) < 0:
+            return
+        self._index += 1
+        # chain from the scheduled end so late ticks don't stretch the tune,
+        # the late note is cut short instead; start from now only if it would
+        # already be over, rather than skipping it
+        start = self._note_end
+        if self._index < len(self._notes) and ticks_diff(now, start) >= self._notes[self._index][1]:
+            start = now
+        self._start_note(start)
+    
+    def _start_note(self, start):
+        if self._index >= len(self._notes):
+            self._pwm.duty_cycle = 0
+            return
+        freq, ms = self._notes[self._index]
+        if freq:
+            self._pwm.frequency = freq
+            self._pwm.duty_cycle = self.volume
+        else:
+            self._pwm.duty_cycle = 0
+        self._note_end = ticks_add(start, ms)
+
+
+sequencer = ToneSequencer(buzzer)
+
+
+def tick():
+    """keep sound effects moving, call this every loop iteration"""
+    sequencer.tick()
+
+
+async def wait(seconds=None):
+    """
+    pause the caller for timed screens, sounds keep playing from the audio task.
+    with no seconds given, waits until the current sound has finished.
+    """
+    if seconds is None:
+        while sequencer.playing:
+            await asyncio.sleep(0.01)
+        return
+    await asyncio.sleep(seconds)
+
+
 def success_sound():
     """correct timing"""
-    tone(523, 0.05)
-    tone(659, 0.08)
+    sequencer.play(SUCCESS)
 
 
 def fail_sound():
     """lost a life"""
-    tone(400, 0.1)
-    tone(300, 0.1)
-    tone(200, 0.15)
+    sequencer.play(FAIL)
 
 
 def wrong_sound():
     """wrong timing"""
-    tone(250, 0.2)
+    sequencer.play(WRONG)
 
 
 def victory_sound():
     """win the game"""
-    tone(392, 0.08)
-    tone(494, 0.08)
-    tone(523, 0.08)
-    tone(659, 0.15)
+    sequencer.play(VICTORY)
 
 
 def game_over_sound():
     """game over"""
-    tone(494, 0.1)
-    tone(440, 0.1)
-    tone(392, 0.1)
-    tone(330, 0.2)
+    sequencer.play(GAME_OVER)
 
 
 def level_up_sound():
     """completed a level"""
-    tone(440, 0.06)
-    tone(494, 0.06)
-    tone(587, 0.1)
-    
-    
+    sequencer.play(LEVEL_UP)
+
+
 def intro_music():
     """play intro music"""
-    tone(784, 0.15)   # G5
-    tone(784, 0.08)   # G5
-    tone(880, 0.15)   # A5
-    tone(784, 0.15)   # G5
-    
-    tone(784, 0.15)   # G5
-    tone(784, 0.08)   # G5
-    tone(988, 0.15)   # B5
-    tone(784, 0.15)   # G5
-    
-    tone(784, 0.15)   # G5
-    tone(784, 0.08)   # G5
-    tone(880, 0.15)   # A5
-    tone(784, 0.15)   # G5
-    
-    tone(698, 0.15)   # F5
-    tone(698, 0.08)   # F5
-    tone(659, 0.15)   # E5
-    tone(587, 0.25)   # D5
+    sequencer.play(INTRO)
@@ -0,0 +1,87 @@
+import digitalio
+from clock import ticks_ms, ticks_diff, ticks_add
+
+
+class DebouncedButton:
+    """
+    Debounced push button that never sleeps.
+    Call update() often; after each call pressed, released and long_pressed are
+    True for exactly that one update when the edge happened.
+    
+    The first edge after a quiet spell is reported straight away and the pin is
+    then ignored for debounce_ms, so presses aren't delayed by the debounce.
+    """
+    
+    def __init__(self, pin, *, pull=digitalio.Pull.UP, debounce_ms=20, long_press_ms=800):
+        self._pin = pin
+        self._pull = pull
+        self._io = None
+        self.debounce_ms = debounce_ms
+        self.long_press_ms = long_press_ms
+        self.resume()
+        
+        # edges from the last update()
+        self.pressed = False
+        self.released = False
+        self.long_pressed = False
+    
+    def resume(self):
+        """claim the pin, e.g. again after suspend()"""
+        self._io = digitalio.DigitalInOut(self._pin)
+        self._io.switch_to_input(pull=self._pull)
+        
+        now = ticks_ms()
+        self._down = self._read()
+        self._last_edge = ticks_add(now, -self.debounce_ms)
+        self._down_at = now
+        self._long_sent = self._down
+    
+    def suspend(self):
+        """release the pin so something else (like a wake alarm) can use it"""
+        if self._io is not None:
+            self._io.deinit()
+            self._io = None
+    
+    def _read(self):
+        level = self._io.value
+        return not level if self._pull == digitalio.Pull.UP else level
+    
+    @property
+    def value(self):
+        """raw pin level, same as digitalio: False while pressed with a pull up"""
+        return self._io.value
+    
+    @property
+    def is_down(self):
+        """debounced state"""
+        return self._down
+    
+    def held_ms(self):
+        """how long the button has been down, 0 if it's up"""
+        if not self._down:
+            return 0
+        return ticks_diff(ticks_ms(), self._down_at)
+    
+    def update(self):
+        """sample the pin and work out edges, returns True if any edge happened"""
+        self.pressed = False
+        self.released = False
+        self.long_pressed = False
+        now = ticks_ms()
+        
+        down = self._read()
+        if down != self._down and ticks_diff(now, self._last_edge) >= self.debounce_ms:
+            self._down = down
+            self._last_edge = now
+            if down:
+                self._down_at = now
+                self._long_sent = False
+                self.pressed = True
+            else:
+                self.released = True
+        
+        if self._down and not self._long_sent and ticks_diff(now, self._down_at) >= self.long_press_ms:
+            self._long_sent = True
+            self.long_pressed = True
+        
+        return self.pressed or self.released or self.long_pressed
@@ -0,0 +1,30 @@
+"""
+millisecond tick counter shared by input, physics and timers
+supervisor.ticks_ms stays a small int on CircuitPython, so reading it doesn't
+allocate the way time.monotonic() floats and monotonic_ns() big ints do.
+ticks wrap, so always compare them with ticks_diff.
+"""
+
+import time
+
+_TICKS_PERIOD = 1 << 29
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALF = _TICKS_PERIOD // 2
+
+try:
+    from supervisor import ticks_ms
+except ImportError:
+    # host python, same wrapping behaviour
+    def ticks_ms():
+        return (time.monotonic_ns() // 1_000_000) & _TICKS_MAX
+
+
+def ticks_add(ticks, delta):
+    """ticks plus delta ms, wrapped"""
+    return (ticks + delta) & _TICKS_MAX
+
+
+def ticks_diff(a, b):
+    """signed ms from b to a, correct across wraparound"""
+    diff = (a - b) & _TICKS_MAX
+    return ((diff + _TICKS_HALF) & _TICKS_MAX) - _TICKS_HALF
@@ -1,42 +1,53 @@
 import board
 import neopixel
-import time
+import asyncio
 import gc
-import displayio
-import terminalio
-from adafruit_display_text import label
 
 from game import run_game, show_splash_screen, run_endless_mode
 from input_handler import main_menu, show_scoreboard
-from sensors import display
+from sensors import display, calibrate_motion
+from tasks import start_background
 
 pixel = neopixel.NeoPixel(board.D6, 1)
 pixel.brightness = 0.1
 
-# show splash screen once at startup
-show_splash_screen(display, pixel)
 
-# main loop
-while True:
-    try:
-        gc.collect()
-        
-        # show main menu
-        choice = main_menu(display, pixel)
-        
-        if choice == "PLAY":
-            result = run_game(pixel)
+async def main():
+    # input, sound and the safe link run for the whole session
+    background = start_background()
+    
+    # the controller is usually sitting still during the splash,
+    # so that's when the accelerometer's resting noise gets measured
+    calibration = asyncio.create_task(calibrate_motion())
+    
+    # show splash screen once at startup
+    await show_splash_screen(display, pixel)
+    await calibration
+    
+    # main loop
+    while True:
+        try:
+            gc.collect()
             
-        elif choice == "ENDLESS":
-            result = run_endless_mode(pixel)
+            # show main menu
+            choice = await main_menu(display, pixel)
             
-        elif choice == "SCOREBOARD":
-            show_scoreboard(display, pixel)
+            if choice == "PLAY":
+                result = await run_game(pixel)
+                
+            elif choice == "ENDLESS":
+                result = await run_endless_mode(pixel)
+                
+            elif choice == "SCOREBOARD":
+                await show_scoreboard(display, pixel)
+                
+            gc.collect()
             
-        gc.collect()
-        
-    except Exception as e:
-        print("Error:", e)
-        pixel[0] = (255, 0, 255)  # purple for error
-        time.sleep(3)
-        gc.collect()
+        except Exception as e:
+            print("Error:", e)
+            pixel[0] = (255, 0, 255)  # purple for error
+            await asyncio.sleep(3)
+            gc.collect()
+
+
+asyncio.run(main())
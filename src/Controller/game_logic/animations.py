@@ -1,91 +1,135 @@
 import time
+import asyncio
 import displayio
 from adafruit_display_text import label
 import terminalio
-import math
-from ui_display import make_pixel
+from trig import polar
+from screens import screens
 
 
-def show_connecting_screen(display, pixel):
+async def show_connecting_screen(display, pixel):
     """display 'Looking for Vault' screen"""
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="LOOKING FOR", x=20, y=25))
-    g.append(label.Label(terminalio.FONT, text="VAULT...", x=35, y=40))
-    display.root_group = g
+    def build(screen):
+        screen.add_label(None, "LOOKING FOR", x=20, y=25)
+        screen.add_label(None, "VAULT...", x=35, y=40)
+    
+    screens.show(display, screens.get("connecting", build))
     pixel[0] = (255, 255, 0)
-    time.sleep(0.5)
+    await asyncio.sleep(0.5)
+
+
+# splash vault layout
+SPLASH_CX, SPLASH_CY = 64, 32
+VAULT_RADIUS = 20
+DIAL_RADIUS = 15
+DIAL_STEP = 20
+COMBO_ANGLES = (0, 120, 240)
+
+# the dial spoke lives in a square tile centred on the vault
+_SPOKE_SIZE = 2 * (DIAL_RADIUS - 1) + 1
+
+
+def _sprite_palette():
+    pal = displayio.Palette(2)
+    pal[0] = 0x000000
+    pal[1] = 0xFFFFFF
+    pal.make_transparent(0)
+    return pal
 
 
-def show_splash_screen(display, pixel):
-    """show intro unlocking animation"""
+def _build_splash_frames():
+    """prerender the splash pieces, returns (static bitmap, spoke atlas, tumbler atlas)"""
+    cx, cy = SPLASH_CX, SPLASH_CY
+    
+    # vault circle never moves
+    static = displayio.Bitmap(2 * VAULT_RADIUS + 1, 2 * VAULT_RADIUS + 1, 2)
+    for a in range(0, 360, 10):
+        x, y = polar(cx, cy, VAULT_RADIUS, a)
+        static[x - cx + VAULT_RADIUS, y - cy + VAULT_RADIUS] = 1
+    
+    # one tile per dial angle, the spoke rotates by DIAL_STEP each frame
+    frames = 360 // DIAL_STEP
+    half = DIAL_RADIUS - 1
+    spokes = displayio.Bitmap(_SPOKE_SIZE * frames, _SPOKE_SIZE, 2)
+    for f in range(frames):
+        for r in range(0, DIAL_RADIUS, 2):
+            x, y = polar(cx, cy, r, f * DIAL_STEP)
+            spokes[f * _SPOKE_SIZE + x - cx + half, y - cy + half] = 1
+    
+    # tumbler tile 0 is locked (single pixel), tile 1 unlocked (3x3 block)
+    tumblers = displayio.Bitmap(6, 3, 2)
+    tumblers[1, 1] = 1
+    for x in range(3, 6):
+        for y in range(3):
+            tumblers[x, y] = 1
+    
+    return static, spokes, tumblers
+
+
+async def show_splash_screen(display, pixel):
+    """show intro unlocking animation, playback only swaps tile indices"""
     from audio import intro_music
     
+    cx, cy = SPLASH_CX, SPLASH_CY
+    static, spokes, tumblers = _build_splash_frames()
+    pal = _sprite_palette()
+    
     splash_group = displayio.Group()
+    splash_group.append(displayio.TileGrid(
+        static, pixel_shader=pal, x=cx - VAULT_RADIUS, y=cy - VAULT_RADIUS
+    ))
+    
+    half = DIAL_RADIUS - 1
+    spoke = displayio.TileGrid(
+        spokes, pixel_shader=pal, tile_width=_SPOKE_SIZE, tile_height=_SPOKE_SIZE,
+        x=cx - half, y=cy - half
+    )
+    splash_group.append(spoke)
+    
+    tumbler_grids = []
+    for tumbler_angle in COMBO_ANGLES:
+        tx, ty = polar(cx, cy, VAULT_RADIUS + 3, tumbler_angle)
+        grid = displayio.TileGrid(
+            tumblers, pixel_shader=pal, tile_width=3, tile_height=3, x=tx - 1, y=ty - 1
+        )
+        tumbler_grids.append(grid)
+        splash_group.append(grid)
+    
+    unlocking_text = label.Label(terminalio.FONT, text="UNLOCKING...", x=22, y=55)
+    granted_text = label.Label(terminalio.FONT, text="ACCESS GRANTED", x=15, y=55)
+    granted_text.hidden = True
+    splash_group.append(unlocking_text)
+    splash_group.append(granted_text)
+    
     display.root_group = splash_group
     
-    start_time = time.monotonic()
     duration = 4.0
+    frame_time = 0.05
+    frame_count = 360 // DIAL_STEP
+    frame = 0
     
-    cx, cy = 64, 32
-    vault_radius = 20
-    combo_angles = [0, 120, 240]
-    tumbler_unlocked = [False, False, False]
-    angle = 0
-    rotation_speed = 20
+    start_time = time.monotonic()
+    next_frame = start_time
     
-    while time.monotonic() - start_time < duration:
+    while True:
         elapsed = time.monotonic() - start_time
+        if elapsed >= duration:
+            break
         progress = elapsed / duration
         
-        while len(splash_group) > 0:
-            splash_group.pop()
-        
-        # draw vault circle
-        for a in range(0, 360, 10):
-            rad = math.radians(a)
-            x = int(cx + vault_radius * math.cos(rad))
-            y = int(cy + vault_radius * math.sin(rad))
-            splash_group.append(make_pixel(x, y))
-        
-        # draw rotating dial
-        dial_angle = angle % 360
-        dial_radius = 15
+        spoke[0] = frame % frame_count
+        frame += 1
         
-        for r in range(0, dial_radius, 2):
-            rad = math.radians(dial_angle)
-            x = int(cx + r * math.cos(rad))
-            y = int(cy + r * math.sin(rad))
-            splash_group.append(make_pixel(x, y))
-        
-        # draw tumblers
-        for i, tumbler_angle in enumerate(combo_angles):
-            rad = math.radians(tumbler_angle)
-            tumbler_x = int(cx + (vault_radius + 3) * math.cos(rad))
-            tumbler_y = int(cy + (vault_radius + 3) * math.sin(rad))
-            
+        for i, grid in enumerate(tumbler_grids):
             if progress > (i + 1) * 0.25:
-                tumbler_unlocked[i] = True
-            
-            if tumbler_unlocked[i]:
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        splash_group.append(make_pixel(tumbler_x + dx, tumbler_y + dy))
-            else:
-                splash_group.append(make_pixel(tumbler_x, tumbler_y))
-        
-        angle = (angle + rotation_speed) % 360
+                grid[0] = 1
         
-        # status text
-        if progress < 0.9:
-            status_text = label.Label(terminalio.FONT, text="UNLOCKING...", x=22, y=55)
-        else:
-            status_text = label.Label(terminalio.FONT, text="ACCESS GRANTED", x=15, y=55)
-        splash_group.append(status_text)
-        
-        # pulse pixel
+        # status text and pulse pixel
         if progress < 0.9:
             pixel[0] = (255, int(progress * 255), 0)
         else:
+            unlocking_text.hidden = True
+            granted_text.hidden = False
             pixel[0] = (0, 255, 0)
         
         try:
@@ -93,7 +137,10 @@ def show_splash_screen(display, pixel):
         except:
             pass
         
-        time.sleep(0.05)
+        # sleep to the next frame boundary so slow frames don't stretch the intro
+        next_frame += frame_time
+        wait = next_frame - time.monotonic()
+        await asyncio.sleep(wait if wait > 0 else 0)
     
     intro_music()
     
@@ -121,20 +168,25 @@ def create_star(x, y):
     return sprite
 
 
-def show_level_transition(display, level_number, remaining_time, new_score):
+async def show_level_transition(display, level_number, remaining_time, new_score):
     """display level complete screen"""
-    from audio import level_up_sound
+    from audio import level_up_sound, wait
+    
+    def build(screen):
+        screen.add_label("level", "", x=5, y=15)
+        screen.add_label("bonus", "", x=5, y=32)
+        screen.add_label("score", "", x=5, y=48)
     
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text=f"LEVEL {level_number} COMPLETE!", x=5, y=15))
-    g.append(label.Label(terminalio.FONT, text=f"Time Bonus: {remaining_time}", x=5, y=32))
-    g.append(label.Label(terminalio.FONT, text=f"Score: {new_score}", x=5, y=48))
-    display.root_group = g
+    screen = screens.get("level_transition", build)
+    screen.set_text("level", f"LEVEL {level_number} COMPLETE!")
+    screen.set_text("bonus", f"Time Bonus: {remaining_time}")
+    screen.set_text("score", f"Score: {new_score}")
+    screens.show(display, screen)
     level_up_sound()
-    time.sleep(1.5)
+    await wait(1.5)
 
 
-def show_stun_animation(display, pixel, time_left, time_label, main_group):
+async def show_stun_animation(display, pixel, time_left, time_label, main_group):
     """show stunned animation when player misses"""
     original_color = pixel[0]
     
@@ -185,12 +237,10 @@ def show_stun_animation(display, pixel, time_left, time_label, main_group):
         
         # animate stars
         for i, star in enumerate(stars):
-            angle = (angle_offset + (i * 360 / num_stars)) % 360
-            rad = math.radians(angle)
-            x = int(cx + radius * math.cos(rad)) - 2
-            y = int(cy + radius * math.sin(rad)) - 2
-            star.x = x
-            star.y = y
+            angle = (angle_offset + i * 360 // num_stars) % 360
+            x, y = polar(cx, cy, radius, angle)
+            star.x = x - 2
+            star.y = y - 2
         
         angle_offset = (angle_offset + 10) % 360
         
@@ -205,7 +255,7 @@ def show_stun_animation(display, pixel, time_left, time_label, main_group):
         except:
             pass
         
-        time.sleep(0.05)
+        await asyncio.sleep(0.05)
     
     pixel[0] = original_color
     return time_left
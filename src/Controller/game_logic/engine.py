@@ -0,0 +1,303 @@
+import random
+import asyncio
+import displayio
+from adafruit_display_text import bitmap_label
+import terminalio
+
+from ui_display import draw_circle_and_arc, build_cursor, update_cursor_rotation, SCREEN_WIDTH
+from refresh_scheduler import RefreshScheduler, CURSOR, LABELS, DIAL
+from input_handler import events, lose_life
+from glyph_text import GlyphLabel
+from input_events import ROTATE, PRESS
+from physics import CursorPhysics
+from clock import ticks_ms, ticks_diff, ticks_add
+from sensors import display, detector, taps, accel_sampler
+from gestures import GestureEvent, registry
+from audio import success_sound, fail_sound
+
+# import from same package
+from .animations import show_stun_animation
+from . import game_modes
+
+# counters are drawn as "TIME: 40", digits start after the prefix
+TIME_PREFIX = "TIME: "
+COUNTER_WIDTH = 9
+
+# game rules run this often, physics and rendering have their own pace
+LOGIC_PERIOD = 0.005
+
+# event instructions show in a strip along the bottom of the dial
+BANNER_Y = 58
+
+# why a round is going badly, passed to Rules.on_fail
+TIMEOUT = 0
+MISS_TIMEOUT = 1
+EVENT_FAIL = 2
+
+
+class Rules:
+    """
+    What a game mode does with hits, misses and running out of time.
+    Modes add setup(engine, fg), on_hit(engine) and finish(engine, status).
+    The engine awaits on_hit and on_fail, each returns None to keep playing or
+    a status string that ends the round; finish() turns that status into the result.
+    """
+    
+    width = 100           # starting success zone width in degrees
+    time_limit = 30       # seconds on the clock
+    event_interval_ms = 4000  # play time between gesture event rolls
+    event_chance = 0.01
+    max_events = 2
+    gestures = None       # gesture registry names to roll from, None for all
+    
+    def __init__(self, lives):
+        self.lives = lives
+    
+    async def on_fail(self, engine, cause):
+        """the clock ran out (TIMEOUT, MISS_TIMEOUT) or a gesture event was failed (EVENT_FAIL)"""
+        return None if cause == EVENT_FAIL else "GAME_OVER"
+    
+    async def lose_life(self, engine):
+        """take a life and update the pixel, returns lose_life's status"""
+        status, self.lives = await lose_life(display, engine.pixel, self.lives)
+        game_modes.update_pixel_color(engine.pixel, self.lives)
+        return status
+
+
+class Engine:
+    """
+    Runs one round of the dial game for any mode.
+    Everything shared (display, input, physics, timer, gesture events,
+    stun on a miss) lives here; the mode's Rules decide what it all means.
+    
+    Physics, rendering and the accelerometer run as their own tasks beside
+    the rules loop, input and audio come from the session's background tasks.
+    """
+    
+    def __init__(self, rules, pixel):
+        self.rules = rules
+        self.pixel = pixel
+        self.time_left = rules.time_limit
+        self.started = ticks_ms()
+        self.frames = None
+        self.time_label = None
+        self.physics = None
+        self.paused = True
+        self._last_tick = 0
+        
+        # gesture events play out while the round keeps running
+        self.gesture = GestureEvent(detector, taps, self._gesture_done)
+        self._event_failed = False
+    
+    def set_time(self, seconds):
+        """change the clock, redrawing only the digits that changed"""
+        self.time_left = seconds
+        self.set_counter(self.time_label, seconds, len(TIME_PREFIX))
+    
+    def set_counter(self, glyph_label, value, start=0):
+        """update a GlyphLabel number, dirtying it only if it changed"""
+        if glyph_label.set_number(value, start):
+            self.frames.mark(LABELS)
+    
+    def _gesture_done(self, passed):
+        if not passed:
+            self._event_failed = True
+    
+    def pause(self):
+        """stop physics and rendering, e.g. before a blocking screen; drops any gesture event"""
+        self.paused = True
+        self.gesture.cancel()
+        self.frames.stop()
+    
+    def resume(self):
+        """carry on after pause() as if no time had passed"""
+        self.frames.start()
+        events.flush()
+        self.physics.resync()
+        self._last_tick = ticks_ms()
+        self.paused = False
+    
+    async def _physics_task(self):
+        physics = self.physics
+        step = physics.step_ms / 1000
+        while True:
+            if not self.paused:
+                physics.update()
+            await asyncio.sleep(step)
+    
+    async def _render_task(self, cursor):
+        # frame budget: sleep whatever is left of the frame after drawing it
+        frame_ms = self.frames.interval_ms
+        next_frame = ticks_ms()
+        while True:
+            if not self.paused:
+                # press events are stamped with the angle the cursor is drawn at
+                angle = self.physics.angle
+                events.tag = angle
+                
+                # update cursor
+                if update_cursor_rotation(cursor, angle):
+                    self.frames.mark(CURSOR)
+                self.frames.refresh()
+            
+            next_frame = ticks_add(next_frame, frame_ms)
+            wait = ticks_diff(next_frame, ticks_ms())
+            if wait < 0:
+                # a frame overran, don't try to catch up
+                next_frame = ticks_ms()
+                wait = 0
+            await asyncio.sleep(wait / 1000)
+    
+    async def run(self):
+        """play until the rules end the round, returns rules.finish()"""
+        rules = self.rules
+        pixel = self.pixel
+        
+        game_modes.target_width = rules.width
+        game_modes.randomize_success_zone()
+        
+        # create display groups
+        main_group = displayio.Group()
+        bg = displayio.Group()
+        fg = displayio.Group()
+        main_group.append(bg)
+        main_group.append(fg)
+        display.root_group = main_group
+        
+        # draw game elements
+        draw_circle_and_arc(bg, game_modes.zone_mask)
+        
+        self.time_label = GlyphLabel(f"{TIME_PREFIX}{self.time_left}", x=0, y=10, width=COUNTER_WIDTH)
+        fg.append(self.time_label.group)
+        rules.setup(self, fg)
+        
+        cursor = build_cursor(fg)
+        
+        # black background so the text reads over the dial
+        banner = bitmap_label.Label(terminalio.FONT, text=" ", x=0, y=BANNER_Y, background_color=0x000000)
+        banner.hidden = True
+        fg.append(banner)
+        
+        # only push frames when something on screen changed
+        self.frames = RefreshScheduler(display)
+        
+        # cursor physics, stepped at a fixed rate whatever the frame rate is
+        self.physics = CursorPhysics()
+        events.tag = 0
+        self.resume()
+        
+        tasks = [
+            asyncio.create_task(self._physics_task()),
+            asyncio.create_task(self._render_task(cursor)),
+            asyncio.create_task(accel_sampler(self.gesture)),
+        ]
+        try:
+            status = await self._rules_loop(main_group, bg, banner)
+        finally:
+            # also on cancellation, so the display gets auto refresh back
+            for task in tasks:
+                task.cancel()
+            self.pause()
+        
+        return await rules.finish(self, status)
+    
+    async def _rules_loop(self, main_group, bg, banner):
+        rules = self.rules
+        physics = self.physics
+        event = self.gesture
+        
+        # event tracking
+        events_used = 0
+        next_roll = ticks_add(ticks_ms(), rules.event_interval_ms)
+        banner_text = None
+        
+        while True:
+            await asyncio.sleep(LOGIC_PERIOD)
+            
+            now = ticks_ms()
+            
+            # gesture challenge, the cursor and clock keep going while it runs
+            if event.active:
+                # the countdown to the next roll only runs between events
+                next_roll = ticks_add(now, rules.event_interval_ms)
+            elif ticks_diff(now, next_roll) >= 0:
+                next_roll = ticks_add(now, rules.event_interval_ms)
+                if events_used < rules.max_events and random.random() < rules.event_chance:
+                    stage = registry.pick(rules.gestures)
+                    if stage is not None:
+                        events_used += 1
+                        event.start(stage, now)
+            event.tick(now)
+            if event.message != banner_text:
+                banner_text = event.message
+                if banner_text is None:
+                    banner.hidden = True
+                else:
+                    banner.text = banner_text
+                    banner.x = (SCREEN_WIDTH - 6 * len(banner_text)) // 2
+                    banner.hidden = False
+                self.frames.mark(LABELS)
+            
+            if self._event_failed:
+                self._event_failed = False
+                fail_sound()
+                self.pause()
+                status = await rules.on_fail(self, EVENT_FAIL)
+                if status is not None:
+                    return status
+                display.root_group = main_group
+                self.resume()
+            
+            # timer countdown
+            if ticks_diff(now, self._last_tick) >= 1000:
+                self._last_tick = now
+                self.set_time(self.time_left - 1)
+                
+                if self.time_left <= 0:
+                    fail_sound()
+                    self.pause()
+                    return await rules.on_fail(self, TIMEOUT)
+            
+            # rotary encoder and button input from the sampler task
+            d = 0
+            button_pressed = False
+            press_angle = 0
+            while events.pop():
+                if events.kind == ROTATE:
+                    d += events.value
+                elif events.kind == PRESS:
+                    # judge the hit where the cursor was when the press was sampled,
+                    # anything after it waits for the next iteration
+                    button_pressed = True
+                    press_angle = events.aux
+                    break
+            
+            physics.push(d)
+            
+            if not button_pressed:
+                continue
+            
+            if game_modes.in_success_zone(press_angle):
+                success_sound()
+                status = await rules.on_hit(self)
+                if status is not None:
+                    return status
+                
+                game_modes.randomize_success_zone()
+                draw_circle_and_arc(bg, game_modes.zone_mask)
+                self.frames.mark(DIAL)
+            
+            else:
+                # miss - stun animation
+                fail_sound()
+                self.pause()
+                self.time_left = await show_stun_animation(display, self.pixel, self.time_left, self.time_label, main_group)
+                
+                if self.time_left <= 0:
+                    return await rules.on_fail(self, MISS_TIMEOUT)
+                
+                # restore display
+                display.root_group = main_group
+                game_modes.randomize_success_zone()
+                draw_circle_and_arc(bg, game_modes.zone_mask)
+                self.resume()
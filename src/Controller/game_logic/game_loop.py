@@ -1,389 +1,201 @@
-import time
-import random
-import displayio
-from adafruit_display_text import label
-import terminalio
 import gc
+from adafruit_display_text import bitmap_label
+import terminalio
 
-from ui_display import draw_circle_and_arc, build_cursor, update_cursor_rotation
-from input_handler import encoder, button, lose_life, enter_initials, game_over_screen, victory_screen
-from sensors import display, run_stay_still_event
-from audio import success_sound, fail_sound, level_up_sound, game_over_sound, victory_sound
+from input_handler import enter_initials, game_over_screen, victory_screen, new_high_score_screen
+from screens import screens
+from glyph_text import GlyphLabel
+from sensors import display
+from audio import fail_sound, level_up_sound, game_over_sound, victory_sound
+import audio
 from high_scores import is_high_score, add_high_score, get_rank
+from clock import ticks_ms, ticks_diff
 
 # import from same package
-from .animations import show_stun_animation, show_level_transition
+from .animations import show_level_transition
+from .engine import Engine, Rules, COUNTER_WIDTH, MISS_TIMEOUT, EVENT_FAIL
 from . import game_modes
 
+HITS_PREFIX = "HITS: "
 
-def run_level(pixel, lives, current_level, score, difficulty, LEVELS, safe_connected, mode="CAMPAIGN"):
-    """Run a single campaign level"""
-    from safe_control import unlock_safe
-    
-    level = LEVELS[current_level]
-    inputs_left = level["inputs"]
-    time_left = level["time"]
-    
-    # set target width
-    game_modes.target_width = level["width"]
-    game_modes.randomize_success_zone()
-    
-    # event tracking
-    events_used = 0
-    MAX_EVENTS = 2
-    event_counter = 0
-    
-    # button debouncing
-    last_button_time = 0
-    DEBOUNCE_TIME = 0.15
-    
-    # create display groups
-    main_group = displayio.Group()
-    bg = displayio.Group()
-    fg = displayio.Group()
-    main_group.append(bg)
-    main_group.append(fg)
-    display.root_group = main_group
-    
-    # draw game elements
-    draw_circle_and_arc(bg, game_modes.target_start, game_modes.target_end)
-    
-    time_label = label.Label(terminalio.FONT, text=f"TIME: {time_left}", x=0, y=10)
-    lvl_label = label.Label(terminalio.FONT, text=f"LVL: {current_level+1}", x=80, y=10)
-    inputs_label = label.Label(terminalio.FONT, text=str(inputs_left), scale=2, x=60, y=38)
-    
-    fg.append(time_label)
-    fg.append(lvl_label)
-    fg.append(inputs_label)
-    
-    cursor = build_cursor(fg)
-    
-    # cursor physics
-    cursor_angle = 0
-    cursor_velocity = 0
-    last_tick = time.monotonic()
-    
-    status = "CONTINUE"
-    
-    # main game loop
-    while True:
-        # stay still challenge
-        event_counter += 1
-        if event_counter >= 200:
-            event_counter = 0
-            if events_used < MAX_EVENTS and random.random() < 0.01:
-                events_used += 1
-                result = run_stay_still_event(main_group)
-                
-                if result == "FAIL":
-                    fail_sound()
-                    status, lives = lose_life(display, pixel, lives)
-                    game_modes.update_pixel_color(pixel, lives)
-                    
-                    if status in ("RESTART", "EXIT"):
-                        return {"status": status, "lives": lives, "score": score, "level": current_level}
-                    break
-                
-                last_tick = time.monotonic()
-        
-        # timer countdown
-        now = time.monotonic()
-        if now - last_tick >= 1:
-            last_tick = now
-            time_left -= 1
-            time_label.text = f"TIME: {time_left}"
-            
-            if time_left <= 0:
-                fail_sound()
-                status, lives = lose_life(display, pixel, lives)
-                game_modes.update_pixel_color(pixel, lives)
-                
-                if status in ("RESTART", "EXIT"):
-                    return {"status": status, "lives": lives, "score": score, "level": current_level}
-                break
-        
-        # rotary encoder input
-        if encoder.update():
-            d = encoder.get_delta()
-        else:
-            d = 0
-        
-        ACCEL = 2.0
-        FRICTION = 0.985
-        MAX_SPEED = 22
-        
-        cursor_velocity += d * ACCEL
-        cursor_velocity = max(min(cursor_velocity, MAX_SPEED), -MAX_SPEED)
-        cursor_velocity *= FRICTION
-        cursor_angle = (cursor_angle + cursor_velocity) % 360
-        
-        # button press detection
-        now_time = time.monotonic()
-        button_pressed = not button.value
-        
-        if button_pressed and (now_time - last_button_time) > DEBOUNCE_TIME:
-            last_button_time = now_time
-            
-            if game_modes.in_success_zone(cursor_angle):
-                success_sound()
-                inputs_left -= 1
-                inputs_label.text = str(inputs_left)
-                
-                game_modes.randomize_success_zone()
-                draw_circle_and_arc(bg, game_modes.target_start, game_modes.target_end)
-                
-                if inputs_left <= 0:
-                    # level complete
-                    score += time_left
-                    current_level += 1
-                    
-                    if current_level >= len(LEVELS):
-                        # win game!
-                        victory_sound()
-                        
-                        # unlock safe
-                        if safe_connected:
-                            try:
-                                unlock_safe()
-                            except Exception as e:
-                                print(f"Unlock error: {e}")
-                        
-                        # check high score
-                        if is_high_score(score, mode="CAMPAIGN"):
-                            rank = get_rank(score, mode="CAMPAIGN")
-                            
-                            g = displayio.Group()
-                            g.append(label.Label(terminalio.FONT, text="NEW HIGH", x=25, y=15, scale=2))
-                            g.append(label.Label(terminalio.FONT, text="SCORE!", x=30, y=35, scale=2))
-                            g.append(label.Label(terminalio.FONT, text=f"Rank #{rank}!", x=30, y=55))
-                            display.root_group = g
-                            pixel[0] = (255, 215, 0)
-                            time.sleep(2)
-                            
-                            initials = enter_initials(display, pixel)
-                            add_high_score(initials, score, difficulty, mode="CAMPAIGN")
-                        
-                        # victory screen
-                        g = displayio.Group()
-                        g.append(label.Label(terminalio.FONT, text="MISSION", x=30, y=8, scale=2))
-                        g.append(label.Label(terminalio.FONT, text="COMPLETE!", x=20, y=28, scale=2))
-                        g.append(label.Label(terminalio.FONT, text="SAFE UNLOCKED!", x=10, y=48))
-                        g.append(label.Label(terminalio.FONT, text=f"Score: {score}", x=30, y=58))
-                        display.root_group = g
-                        pixel[0] = (0, 255, 0)
-                        time.sleep(3)
-                        
-                        play_again = victory_screen(display, score)
-                        gc.collect()
-                        
-                        status = "RESTART" if play_again else "EXIT"
-                        return {"status": status, "lives": lives, "score": score, "level": current_level}
-                    
-                    show_level_transition(display, current_level, time_left, score)
-                    gc.collect()
-                    break
+
+class CampaignRules(Rules):
+    """
+    Clear the level's hits before the clock runs out.
+    Running out of time costs a life and retries the level.
+    """
+    
+    def __init__(self, lives, current_level, score, difficulty, levels, safe_connected):
+        super().__init__(lives)
+        level = levels[current_level]
+        self.width = level["width"]
+        self.time_limit = level["time"]
+        self.inputs_left = level["inputs"]
+        self.level = current_level
+        self.score = score
+        self.difficulty = difficulty
+        self.levels = levels
+        self.safe_connected = safe_connected
+    
+    def setup(self, engine, fg):
+        self.inputs_label = GlyphLabel(str(self.inputs_left), x=60, y=38, width=1, scale=2)
+        fg.append(bitmap_label.Label(terminalio.FONT, text=f"LVL: {self.level+1}", x=80, y=10))
+        fg.append(self.inputs_label.group)
+    
+    async def on_hit(self, engine):
+        self.inputs_left -= 1
+        engine.set_counter(self.inputs_label, self.inputs_left)
+        if self.inputs_left > 0:
+            return None
+        
+        # level complete
+        engine.pause()
+        self.score += engine.time_left
+        self.level += 1
+        
+        if self.level >= len(self.levels):
+            return await self._win(engine)
+        
+        await show_level_transition(display, self.level, engine.time_left, self.score)
+        gc.collect()
+        return "CONTINUE"
+    
+    async def _win(self, engine):
+        from safe_control import unlock_safe
+        pixel = engine.pixel
+        score = self.score
+        victory_sound()
+        
+        # unlock safe
+        if self.safe_connected:
+            try:
+                unlock_safe()
+            except Exception as e:
+                print(f"Unlock error: {e}")
+        
+        # check high score
+        if is_high_score(score, mode="CAMPAIGN"):
+            rank = get_rank(score, mode="CAMPAIGN")
+            await new_high_score_screen(display, pixel, rank)
             
-            else:
-                # miss - stun animation
-                fail_sound()
-                time_left = show_stun_animation(display, pixel, time_left, time_label, main_group)
-                
-                if time_left <= 0:
-                    fail_sound()
-                    status, lives = lose_life(display, pixel, lives)
-                    game_modes.update_pixel_color(pixel, lives)
-                    
-                    if status in ("RESTART", "EXIT"):
-                        game_over_sound()
-                        gc.collect()
-                        return {"status": status, "lives": lives, "score": score, "level": current_level}
-                    break
-                
-                # restore display
-                display.root_group = main_group
-                game_modes.randomize_success_zone()
-                draw_circle_and_arc(bg, game_modes.target_start, game_modes.target_end)
-                last_tick = time.monotonic()
-        
-        # update cursor
-        update_cursor_rotation(cursor, cursor_angle)
-        display.refresh(minimum_frames_per_second=0)
-    
-    # level end
-    if status in ("RESTART", "EXIT"):
-        game_over_sound()
+            initials = await enter_initials(display, pixel)
+            add_high_score(initials, score, self.difficulty, mode="CAMPAIGN")
+        
+        # victory screen
+        def build(screen):
+            screen.add_label(None, "MISSION", x=30, y=8, scale=2)
+            screen.add_label(None, "COMPLETE!", x=20, y=28, scale=2)
+            screen.add_label(None, "SAFE UNLOCKED!", x=10, y=48)
+            screen.add_label("score", "", x=30, y=58)
+        
+        screen = screens.get("mission_complete", build)
+        screen.set_text("score", f"Score: {score}")
+        screens.show(display, screen)
+        pixel[0] = (0, 255, 0)
+        await audio.wait(3)
+        
+        play_again = await victory_screen(display, score)
         gc.collect()
-        return {"status": status, "lives": lives, "score": score, "level": current_level}
+        return "RESTART" if play_again else "EXIT"
     
-    return {"status": "CONTINUE", "lives": lives, "score": score, "level": current_level}
+    async def on_fail(self, engine, cause):
+        # CONTINUE from lose_life means lives are left, the level is retried
+        if cause == MISS_TIMEOUT:
+            fail_sound()
+        return await self.lose_life(engine)
+    
+    async def finish(self, engine, status):
+        # run_campaign_mode collects after RESTART and EXIT
+        return {"status": status, "lives": self.lives, "score": self.score, "level": self.level}
 
 
-def run_endless_level(pixel, lives, starting_width, safe_connected):
-    """endless mode"""
-    from safe_control import unlock_safe
-    
-    total_hits = 0
-    time_left = 30
-    game_modes.target_width = starting_width
-    game_modes.randomize_success_zone()
-    
-    # event tracking
-    events_used = 0
-    MAX_EVENTS = 2
-    event_counter = 0
-    
-    last_button_time = 0
-    DEBOUNCE_TIME = 0.15
-    
-    # create display
-    main_group = displayio.Group()
-    bg = displayio.Group()
-    fg = displayio.Group()
-    main_group.append(bg)
-    main_group.append(fg)
-    display.root_group = main_group
-    
-    draw_circle_and_arc(bg, game_modes.target_start, game_modes.target_end)
-    
-    time_label = label.Label(terminalio.FONT, text=f"TIME: {time_left}", x=0, y=10)
-    hits_label = label.Label(terminalio.FONT, text=f"HITS: {total_hits}", x=70, y=10)
-    
-    fg.append(time_label)
-    fg.append(hits_label)
-    
-    cursor = build_cursor(fg)
-    
-    # cursor physics
-    cursor_angle = 0
-    cursor_velocity = 0
-    last_tick = time.monotonic()
-    game_start_time = time.monotonic()
-    
-    status = "CONTINUE"
-    
-    while True:
-        # Random events
-        event_counter += 1
-        if event_counter >= 500:
-            event_counter = 0
-            if events_used < MAX_EVENTS and random.random() < 0.005:
-                events_used += 1
-                result = run_stay_still_event(main_group)
-                
-                if result == "FAIL":
-                    fail_sound()
-                    status, lives = lose_life(display, pixel, lives)
-                    game_modes.update_pixel_color(pixel, lives)
-                    
-                    if status in ("RESTART", "EXIT"):
-                        break
-                    
-                    display.root_group = main_group
-                last_tick = time.monotonic()
-        
-        # timer
-        now = time.monotonic()
-        if now - last_tick >= 1:
-            last_tick = now
-            time_left -= 1
-            time_label.text = f"TIME: {time_left}"
-            
-            if time_left <= 0:
-                fail_sound()
-                break
-        
-        # encoder input
-        if encoder.update():
-            d = encoder.get_delta()
-        else:
-            d = 0
+class EndlessRules(Rules):
+    """
+    Each hit adds a second and every third hit shrinks the zone.
+    Plays until the clock runs out.
+    """
+    
+    time_limit = 30
+    event_interval_ms = 10000
+    event_chance = 0.005
+    
+    def __init__(self, lives, starting_width, safe_connected):
+        super().__init__(lives)
+        self.width = starting_width
+        self.total_hits = 0
+        self.safe_connected = safe_connected
+    
+    def setup(self, engine, fg):
+        self.hits_label = GlyphLabel(f"{HITS_PREFIX}{self.total_hits}", x=70, y=10, width=COUNTER_WIDTH)
+        fg.append(self.hits_label.group)
+    
+    async def on_hit(self, engine):
+        self.total_hits += 1
+        engine.set_counter(self.hits_label, self.total_hits, len(HITS_PREFIX))
+        engine.set_time(engine.time_left + 1)
+        
+        # shrink target
+        if self.total_hits % 3 == 0:
+            game_modes.target_width = max(25, game_modes.target_width - 2)
+            level_up_sound()
+        return None
+    
+    async def on_fail(self, engine, cause):
+        if cause != EVENT_FAIL or await self.lose_life(engine) in ("RESTART", "EXIT"):
+            return "GAME_OVER"
+        return None
+    
+    async def finish(self, engine, status):
+        from safe_control import unlock_safe
+        pixel = engine.pixel
+        total_hits = self.total_hits
         
-        ACCEL = 2.0
-        FRICTION = 0.985
-        MAX_SPEED = 22
-        
-        cursor_velocity += d * ACCEL
-        cursor_velocity = max(min(cursor_velocity, MAX_SPEED), -MAX_SPEED)
-        cursor_velocity *= FRICTION
-        cursor_angle = (cursor_angle + cursor_velocity) % 360
-        
-        # button press
-        now_time = time.monotonic()
-        button_pressed = not button.value
-        
-        if button_pressed and (now_time - last_button_time) > DEBOUNCE_TIME:
-            last_button_time = now_time
-            
-            if game_modes.in_success_zone(cursor_angle):
-                # SUCCESS
-                success_sound()
-                total_hits += 1
-                hits_label.text = f"HITS: {total_hits}"
-                time_left += 1
-                time_label.text = f"TIME: {time_left}"
-                
-                # shrink target
-                if total_hits % 3 == 0:
-                    game_modes.target_width = max(25, game_modes.target_width - 2)
-                    level_up_sound()
-                
-                game_modes.randomize_success_zone()
-                draw_circle_and_arc(bg, game_modes.target_start, game_modes.target_end)
+        game_over_sound()
+        final_time = ticks_diff(ticks_ms(), engine.started) // 1000
+        
+        if self.safe_connected and final_time >= 120:
+            try:
+                unlock_safe()
+            except:
+                pass
+        
+        # show stats
+        def build(screen):
+            screen.add_label(None, "GAME OVER!", x=22, y=5)
+            screen.add_label("hits", "", x=5, y=25)
+            screen.add_label("time", "", x=5, y=40)
+            screen.add_label("width", "", x=5, y=55)
+        
+        screen = screens.get("endless_stats", build)
+        screen.set_text("hits", f"Hits: {total_hits}")
+        screen.set_text("time", f"Time: {final_time}s")
+        screen.set_text("width", f"Width: {game_modes.target_width}")
+        screens.show(display, screen)
+        pixel[0] = (255, 0, 0)
+        await audio.wait(3)
+        
+        # check high score
+        if is_high_score(total_hits, mode="ENDLESS"):
+            rank = get_rank(total_hits, mode="ENDLESS")
+            await new_high_score_screen(display, pixel, rank)
             
-            else:
-                # MISS
-                fail_sound()
-                time_left = show_stun_animation(display, pixel, time_left, time_label, main_group)
-                
-                if time_left <= 0:
-                    break
-                
-                display.root_group = main_group
-                game_modes.randomize_success_zone()
-                draw_circle_and_arc(bg, game_modes.target_start, game_modes.target_end)
-                last_tick = time.monotonic()
-        
-        # update cursor
-        update_cursor_rotation(cursor, cursor_angle)
-        display.refresh(minimum_frames_per_second=0)
-    
-    # GAME OVER
-    game_over_sound()
-    final_time = int(time.monotonic() - game_start_time)
-    
-    if safe_connected and final_time >= 120:
-        try:
-            unlock_safe()
-        except:
-            pass
-    
-    # show stats
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="GAME OVER!", x=22, y=5))
-    g.append(label.Label(terminalio.FONT, text=f"Hits: {total_hits}", x=5, y=25))
-    g.append(label.Label(terminalio.FONT, text=f"Time: {final_time}s", x=5, y=40))
-    g.append(label.Label(terminalio.FONT, text=f"Width: {game_modes.target_width}", x=5, y=55))
-    display.root_group = g
-    pixel[0] = (255, 0, 0)
-    time.sleep(3)
-    
-    # check high score
-    if is_high_score(total_hits, mode="ENDLESS"):
-        rank = get_rank(total_hits, mode="ENDLESS")
+            initials = await enter_initials(display, pixel)
+            add_high_score(initials, total_hits, "ENDLESS", mode="ENDLESS")
         
-        g = displayio.Group()
-        g.append(label.Label(terminalio.FONT, text="NEW HIGH", x=25, y=15, scale=2))
-        g.append(label.Label(terminalio.FONT, text="SCORE!", x=30, y=35, scale=2))
-        g.append(label.Label(terminalio.FONT, text=f"Rank #{rank}!", x=30, y=55))
-        display.root_group = g
-        pixel[0] = (255, 215, 0)
-        time.sleep(2)
+        restart = await game_over_screen(display)
+        gc.collect()
         
-        initials = enter_initials(display, pixel)
-        add_high_score(initials, total_hits, "ENDLESS", mode="ENDLESS")
-    
-    restart = game_over_screen(display)
-    gc.collect()
-    
-    status = "RESTART" if restart else "EXIT"
-    return {"status": status}
+        status = "RESTART" if restart else "EXIT"
+        return {"status": status}
+
+
+async def run_level(pixel, lives, current_level, score, difficulty, LEVELS, safe_connected, mode="CAMPAIGN"):
+    """Run a single campaign level"""
+    rules = CampaignRules(lives, current_level, score, difficulty, LEVELS, safe_connected)
+    return await Engine(rules, pixel).run()
+
+
+async def run_endless_level(pixel, lives, starting_width, safe_connected):
+    """endless mode"""
+    rules = EndlessRules(lives, starting_width, safe_connected)
+    return await Engine(rules, pixel).run()
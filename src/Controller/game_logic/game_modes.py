@@ -1,11 +1,10 @@
-import time
-import displayio
-from adafruit_display_text import label
-import terminalio
+import asyncio
 import gc
 
 from input_handler import difficulty_select
 from sensors import display
+from screens import screens
+from zones import new_mask, clear, add_span, contains
 from .animations import show_connecting_screen
 
 # 10 levels
@@ -22,9 +21,10 @@ LEVELS = [
     {"inputs": 8, "time": 45, "width": 50},
 ]
 
-target_start = 0
-target_end = 0
+# every success zone on the dial, hit testing and drawing both read this
+zone_mask = new_mask()
 target_width = 100
+zone_count = 1
 
 
 def update_pixel_color(pixel, lives):
@@ -34,47 +34,45 @@ def update_pixel_color(pixel, lives):
 
 
 def randomize_success_zone():
-    """create new random success/target zone"""
+    """create new random success/target zones, zone_count of them target_width wide"""
     import random
-    global target_start, target_end, target_width
-    target_start = random.randint(0, 359)
-    target_end = (target_start + target_width) % 360
+    clear(zone_mask)
+    for _ in range(zone_count):
+        add_span(zone_mask, random.randint(0, 359), target_width)
 
 
 def in_success_zone(angle):
-    """check if cursor angle is in the success zone"""
-    if target_start < target_end:
-        return target_start <= angle <= target_end
-    return angle >= target_start or angle <= target_end
+    """check if a whole-degree cursor angle is in a success zone"""
+    return contains(zone_mask, angle)
 
 
-def run_campaign_mode(pixel):
+async def run_campaign_mode(pixel):
     """campaign mode - 10 levels"""
     from safe_control import connect_to_safe, lock_safe
     from .game_loop import run_level
     from audio import game_over_sound
     
     gc.collect()
-    show_connecting_screen(display, pixel)
+    await show_connecting_screen(display, pixel)
     
     safe_connected = False
     try:
-        if connect_to_safe():
+        if await connect_to_safe():
             lock_safe()
             safe_connected = True
     except Exception as e:
         print(f"Safe error: {e}")
     
-    difficulty = difficulty_select(display, pixel)
+    difficulty = await difficulty_select(display, pixel)
     lives = {"EASY": 3, "MEDIUM": 2, "HARD": 1}[difficulty]
-    time.sleep(0.3)
+    await asyncio.sleep(0.3)
     update_pixel_color(pixel, lives)
     
     current_level = 0
     score = 0
     
     while True:
-        result = run_level(
+        result = await run_level(
             pixel, lives, current_level, score, difficulty,
             LEVELS, safe_connected, mode="CAMPAIGN"
         )
@@ -89,17 +87,17 @@ def run_campaign_mode(pixel):
         current_level = result["level"]
 
 
-def run_endless_mode(pixel):
+async def run_endless_mode(pixel):
     """endless mode - survive as long as possible"""
     from safe_control import connect_to_safe, lock_safe
     from .game_loop import run_endless_level
     
     gc.collect()
-    show_connecting_screen(display, pixel)
+    await show_connecting_screen(display, pixel)
     
     safe_connected = False
     try:
-        if connect_to_safe():
+        if await connect_to_safe():
             lock_safe()
             safe_connected = True
     except Exception as e:
@@ -110,14 +108,15 @@ def run_endless_mode(pixel):
     update_pixel_color(pixel, lives)
     
     # Show intro
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="ENDLESS MODE", x=20, y=15))
-    g.append(label.Label(terminalio.FONT, text="Survive as long", x=12, y=30))
-    g.append(label.Label(terminalio.FONT, text="as you can!", x=22, y=42))
-    g.append(label.Label(terminalio.FONT, text="+1s per hit", x=25, y=54))
-    display.root_group = g
-    time.sleep(2.5)
+    def build(screen):
+        screen.add_label(None, "ENDLESS MODE", x=20, y=15)
+        screen.add_label(None, "Survive as long", x=12, y=30)
+        screen.add_label(None, "as you can!", x=22, y=42)
+        screen.add_label(None, "+1s per hit", x=25, y=54)
     
-    result = run_endless_level(pixel, lives, starting_width, safe_connected)
+    screens.show(display, screens.get("endless_intro", build))
+    await asyncio.sleep(2.5)
+    
+    result = await run_endless_level(pixel, lives, starting_width, safe_connected)
     gc.collect()
     return result["status"]
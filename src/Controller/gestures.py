@@ -0,0 +1,231 @@
+import math
+import random
+from clock import ticks_ms, ticks_diff
+from motion_detector import STILL, SHAKE
+
+# event states
+IDLE = 0
+WARNING = 1
+WATCHING = 2
+
+# 1 g in accelerometer counts (4 mg each)
+ONE_G = 250
+
+
+class Gesture:
+    """
+    One detector stage: what the player is asked to do and how to tell they did it.
+    begin() runs when the watch starts, check() on every tick after that and
+    returns True (passed), False (failed) or None (keep watching). When watch_ms
+    runs out the event ends with timeout_result.
+    
+    Stages only look at sums MotionDetector already keeps, so check() is constant
+    time and safe to call from the rules loop.
+    """
+    
+    prompt = ""
+    watch_ms = 3000
+    timeout_result = False
+    
+    def begin(self, event):
+        pass
+    
+    def check(self, event):
+        return None
+
+
+class StayStill(Gesture):
+    """hold still, any movement, jolt or drift from the starting pose fails"""
+    
+    prompt = "STAY STILL"
+    timeout_result = True
+    
+    def check(self, event):
+        if event.detector.classify() != STILL:
+            return False
+        return None
+
+
+class Shake(Gesture):
+    """shake the controller hard enough for the detector to call it SHAKE"""
+    
+    prompt = "SHAKE IT"
+    
+    def check(self, event):
+        if event.detector.classify() == SHAKE:
+            return True
+        return None
+
+
+class Tilt(Gesture):
+    """
+    Tilt by at least degrees along axis, measured as the window mean moving
+    from the pose at the end of the warning. The sign of degrees picks the
+    direction; which one reads as left depends on how the board is mounted.
+    """
+    
+    def __init__(self, prompt, axis, degrees):
+        self.prompt = prompt
+        self.axis = axis
+        counts = int(ONE_G * math.sin(math.radians(abs(degrees))))
+        self.counts = counts if degrees > 0 else -counts
+    
+    def check(self, event):
+        d = event.detector
+        shift = d.mean(self.axis) - d.reference(self.axis)
+        if self.counts > 0:
+            return True if shift >= self.counts else None
+        return True if shift <= self.counts else None
+
+
+class Flip(Gesture):
+    """turn the controller over, z has to settle past half a g the other way"""
+    
+    prompt = "FLIP IT"
+    
+    def check(self, event):
+        d = event.detector
+        z = d.mean(2)
+        if d.reference(2) >= 0:
+            return True if z < -ONE_G // 2 else None
+        return True if z > ONE_G // 2 else None
+
+
+class Tap(Gesture):
+    """tap the controller, using the ADXL345's own tap detection"""
+    
+    def __init__(self, double=False):
+        self.double = double
+        self.prompt = "DOUBLE TAP" if double else "TAP IT"
+    
+    def begin(self, event):
+        # taps during the warning don't count
+        self._seen = event.taps[1 if self.double else 0]
+    
+    def check(self, event):
+        if event.taps[1 if self.double else 0] != self._seen:
+            return True
+        return None
+
+
+class GestureRegistry:
+    """
+    The gesture events a round can roll, by name.
+    register() adds a stage with a weight, pick() draws one at random,
+    optionally from a subset of names.
+    """
+    
+    def __init__(self):
+        self._names = []
+        self._stages = []
+        self._weights = []
+    
+    def register(self, name, stage, weight=1):
+        """add stage under name, replacing any stage already there"""
+        if name in self._names:
+            i = self._names.index(name)
+            self._stages[i] = stage
+            self._weights[i] = weight
+            return
+        self._names.append(name)
+        self._stages.append(stage)
+        self._weights.append(weight)
+    
+    def get(self, name):
+        return self._stages[self._names.index(name)]
+    
+    def names(self):
+        return tuple(self._names)
+    
+    def pick(self, names=None):
+        """a weighted random stage, from names if given, None if there's nothing to pick"""
+        total = 0
+        for name, weight in zip(self._names, self._weights):
+            if names is None or name in names:
+                total += weight
+        if total <= 0:
+            return None
+        
+        r = random.randrange(total)
+        for name, stage, weight in zip(self._names, self._stages, self._weights):
+            if names is None or name in names:
+                if r < weight:
+                    return stage
+                r -= weight
+        return None
+
+
+class GestureEvent:
+    """
+    A gesture challenge as a state machine the game loop advances with tick().
+    start(stage) warns for warn_ms, then watches the stage's check() for up to
+    the stage's watch_ms and calls on_result(passed) once at the end.
+    
+    detector is a MotionDetector and taps the [single, double] tap counters,
+    both kept up by sensors.accel_sampler while the event is active, so
+    tick() never waits on the accelerometer. The pose at the end of the
+    warning is the reference tilts and flips are measured from. message is
+    the text for the current state, None when idle.
+    """
+    
+    def __init__(self, detector, taps, on_result, *, warn_ms=1000):
+        self.detector = detector
+        self.taps = taps
+        self._on_result = on_result
+        self.warn_ms = warn_ms
+        self.stage = None
+        self.cancel()
+    
+    @property
+    def active(self):
+        return self.state != IDLE
+    
+    def start(self, stage, now=None):
+        """show the stage's warning, the watch starts warn_ms later"""
+        now = ticks_ms() if now is None else now
+        self.stage = stage
+        self.state = WARNING
+        self._since = now
+        self.message = f"{stage.prompt} IN {self.warn_ms // 1000}s"
+    
+    def cancel(self):
+        """drop the event without a result, e.g. when the round is interrupted"""
+        self.state = IDLE
+        self.message = None
+    
+    def _finish(self, passed):
+        self.cancel()
+        self._on_result(passed)
+    
+    def tick(self, now=None):
+        """advance the event, call every game loop iteration"""
+        if self.state == IDLE:
+            return
+        now = ticks_ms() if now is None else now
+        elapsed = ticks_diff(now, self._since)
+        stage = self.stage
+        
+        if self.state == WARNING:
+            if elapsed >= self.warn_ms:
+                self.detector.set_reference()
+                stage.begin(self)
+                self.state = WATCHING
+                self._since = now
+                self.message = f"{stage.prompt}!"
+            return
+        
+        result = stage.check(self)
+        if result is not None:
+            self._finish(result)
+        elif elapsed >= stage.watch_ms:
+            self._finish(stage.timeout_result)
+
+
+# every event the game knows about; a mode's Rules.gestures picks from these by name
+registry = GestureRegistry()
+registry.register("still", StayStill(), weight=3)
+registry.register("shake", Shake())
+registry.register("tilt_left", Tilt("TILT LEFT", 0, -30))
+registry.register("tilt_right", Tilt("TILT RIGHT", 0, 30))
+registry.register("flip", Flip())
+registry.register("tap", Tap(double=True))
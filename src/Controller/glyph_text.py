@@ -0,0 +1,157 @@
+"""
+Text drawn straight from the terminalio font bitmap.
+A GlyphLabel is one TileGrid with a tile per character, so changing text only
+rewrites the tile indices of characters that changed instead of rebuilding a
+TileGrid per glyph the way label.Label does.
+"""
+
+import displayio
+import terminalio
+
+FONT = terminalio.FONT
+GLYPH_WIDTH, GLYPH_HEIGHT = FONT.get_bounding_box()[:2]
+
+# codepoint -> tile index in the font bitmap, digits and space filled up front
+_tile_cache = {}
+
+def glyph_index(ch):
+    """tile index of a character in the terminalio font bitmap"""
+    idx = _tile_cache.get(ch)
+    if idx is None:
+        glyph = FONT.get_glyph(ord(ch))
+        if glyph is None:
+            glyph = FONT.get_glyph(ord("?"))
+        idx = glyph.tile_index
+        _tile_cache[ch] = idx
+    return idx
+
+for _ch in " -0123456789":
+    glyph_index(_ch)
+
+_SPACE = _tile_cache[" "]
+_MINUS = _tile_cache["-"]
+_DIGITS = [_tile_cache[c] for c in "0123456789"]
+
+
+_palette = None
+
+def _get_palette():
+    global _palette
+    if _palette is None:
+        _palette = displayio.Palette(2)
+        _palette[0] = 0x000000
+        _palette[1] = 0xFFFFFF
+        _palette.make_transparent(0)
+    return _palette
+
+
+class GlyphLabel:
+    """
+    Fixed-width text label. x, y follow label.Label: y is the vertical middle of the text.
+    width is the number of character cells, text longer than that is cut off.
+    """
+    
+    def __init__(self, text, x, y, *, width=None, scale=1):
+        if width is None:
+            width = len(text)
+        self.width = width
+        self.scale = scale
+        self._text = ""
+        
+        self._grid = displayio.TileGrid(
+            FONT.bitmap, pixel_shader=_get_palette(),
+            width=width, height=1,
+            tile_width=GLYPH_WIDTH, tile_height=GLYPH_HEIGHT,
+            default_tile=_SPACE
+        )
+        self.group = displayio.Group(x=x, y=y - GLYPH_HEIGHT * scale // 2, scale=scale)
+        self.group.append(self._grid)
+        self.text = text
+    
+    @property
+    def x(self):
+        return self.group.x
+    
+    @property
+    def y(self):
+        return self.group.y
+    
+    @property
+    def bounding_box(self):
+        """unscaled x, y, w, h relative to x, y, same shape as label.Label's"""
+        return 0, 0, self.width * GLYPH_WIDTH, GLYPH_HEIGHT
+    
+    @property
+    def text(self):
+        if self._text is None:
+            # only rebuilt when read after set_number changed the digits
+            chars = {idx: ch for ch, idx in _tile_cache.items()}
+            grid = self._grid
+            self._text = "".join(chars.get(grid[i], "?") for i in range(self.width)).rstrip()
+        return self._text
+    
+    @text.setter
+    def text(self, text):
+        self.set_text(text)
+    
+    def set_text(self, text, start=0):
+        """write text from cell start on, blanking the rest; returns True if any cell changed"""
+        grid = self._grid
+        changed = False
+        n = len(text)
+        for i in range(start, self.width):
+            j = i - start
+            idx = glyph_index(text[j]) if j < n else _SPACE
+            if grid[i] != idx:
+                grid[i] = idx
+                changed = True
+        # keep .text to what's drawn, the cells before start are left as they were
+        shown = text[:self.width - start]
+        self._text = self.text[:start] + shown if start else shown
+        return changed
+    
+    def set_number(self, value, start=0):
+        """
+        write an integer left-aligned from cell start on without building a string,
+        only digits that differ from what's shown are touched; returns True if any changed
+        """
+        grid = self._grid
+        width = self.width
+        
+        # count digits so the number can be written left to right
+        neg = value < 0
+        if neg:
+            value = -value
+        digits = 1
+        p = 10
+        while p <= value:
+            digits += 1
+            p *= 10
+        
+        changed = False
+        i = start
+        if neg and i < width:
+            if grid[i] != _MINUS:
+                grid[i] = _MINUS
+                changed = True
+            i += 1
+        
+        p //= 10
+        while p and i < width:
+            idx = _DIGITS[(value // p) % 10]
+            if grid[i] != idx:
+                grid[i] = idx
+                changed = True
+            p //= 10
+            i += 1
+        
+        while i < width:
+            if grid[i] != _SPACE:
+                grid[i] = _SPACE
+                changed = True
+            i += 1
+        
+        if changed:
+            # .text is rebuilt from the grid if someone reads it
+            self._text = None
+        return changed
@@ -0,0 +1,81 @@
+import digitalio
+from clock import ticks_ms, ticks_diff
+
+
+class IdleSleeper:
+    """
+    Light-sleeps the board when a menu has sat without input for timeout_s.
+    Wakes when any wake pin (encoder A/B and the button) that rests high is pulled
+    low, then hands the pins back to their owners so the menu carries on where it was.
+    
+    Anything in devices needs suspend() and resume() to release and reclaim
+    its pins, since a pin can't be read and used as an alarm at the same time.
+    PinAlarm's pull opposes the level it waits for, so only a low can be armed
+    with the pull-ups the switches need; a pin already resting low is left out
+    and turning the knob wakes the board through the other encoder pin.
+    alarm_module defaults to CircuitPython's alarm, pass a stand-in to run off the board.
+    """
+    
+    def __init__(self, wake_pins, devices, *, timeout_s=30, alarm_module=None):
+        self._wake_pins = wake_pins
+        self._devices = devices
+        self._alarm = alarm_module
+        self.timeout_ms = int(timeout_s * 1000)
+        self.sleeps = 0
+        self.touch()
+    
+    def touch(self):
+        """note that there was input just now"""
+        self._last_input = ticks_ms()
+    
+    def due(self):
+        """True once the timeout has passed without input"""
+        return ticks_diff(ticks_ms(), self._last_input) >= self.timeout_ms
+    
+    def _alarm_module(self):
+        if self._alarm is None:
+            import alarm
+            self._alarm = alarm
+        return self._alarm
+    
+    def _wake_alarms(self, alarm):
+        # wake on low with the pull-up on, for every pin that isn't low already
+        alarms = []
+        for pin in self._wake_pins:
+            io = digitalio.DigitalInOut(pin)
+            io.switch_to_input(pull=digitalio.Pull.UP)
+            level = io.value
+            io.deinit()
+            if level:
+                alarms.append(alarm.pin.PinAlarm(pin, value=False, pull=True))
+        return alarms
+    
+    def sleep(self, display=None):
+        """light sleep until a wake pin changes, blanking display if given; returns the alarm that woke us"""
+        alarm = self._alarm_module()
+        
+        for device in self._devices:
+            device.suspend()
+        if display is not None and hasattr(display, "sleep"):
+            display.sleep()
+        
+        try:
+            woke = alarm.light_sleep_until_alarms(*self._wake_alarms(alarm))
+        finally:
+            if display is not None and hasattr(display, "wake"):
+                display.wake()
+            for device in self._devices:
+                device.resume()
+            self.sleeps += 1
+            self.touch()
+        return woke
+    
+    def check(self, had_input, display=None):
+        """call once per menu iteration, sleeps if it's been idle too long; returns True if it slept"""
+        if had_input:
+            self.touch()
+            return False
+        if not self.due():
+            return False
+        self.sleep(display)
+        return True
@@ -0,0 +1,111 @@
+from array import array
+from clock import ticks_ms
+
+# event kinds
+ROTATE = 1       # value is detents, + clockwise
+PRESS = 2
+RELEASE = 3
+LONG_PRESS = 4   # button held past its long press time, comes after PRESS
+
+
+class InputQueue:
+    """
+    Samples the encoder and a DebouncedButton into a fixed-size ring buffer of
+    timestamped events. Everything is preallocated, so polling and popping
+    don't allocate.
+    
+    Each event also carries an aux value given to poll(), the game loop passes
+    the cursor angle so a press can be judged where the cursor was when it
+    was sampled.
+    
+    Read events with:
+        while events.pop():
+            events.kind, events.value, events.time, events.aux
+    """
+    
+    def __init__(self, encoder, button, size=32):
+        self._encoder = encoder
+        self._button = button
+        
+        self._size = size
+        self._kinds = bytearray(size)
+        self._values = array("h", [0] * size)
+        self._times = array("l", [0] * size)
+        self._auxs = array("h", [0] * size)
+        self._head = 0
+        self._count = 0
+        
+        # events that didn't fit, rotations are merged instead of dropped
+        self.dropped = 0
+        
+        # aux the background sampler stamps on events, e.g. the drawn cursor angle
+        self.tag = 0
+        
+        # last popped event
+        self.kind = 0
+        self.value = 0
+        self.time = 0
+        self.aux = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def push(self, kind, value, t, aux=0):
+        """add an event, merging rotations into a queued rotation when full"""
+        size = self._size
+        if self._count:
+            last = (self._head + self._count - 1) % size
+            if kind == ROTATE and self._kinds[last] == ROTATE and (self._count == size or self._values[last] * value > 0):
+                self._values[last] += value
+                return
+        if self._count == size:
+            self.dropped += 1
+            return
+        
+        i = (self._head + self._count) % size
+        self._kinds[i] = kind
+        self._values[i] = value
+        self._times[i] = t
+        self._auxs[i] = aux
+        self._count += 1
+    
+    def pop(self):
+        """move the oldest event into kind/value/time/aux, returns False if empty"""
+        if not self._count:
+            return False
+        i = self._head
+        self.kind = self._kinds[i]
+        self.value = self._values[i]
+        self.time = self._times[i]
+        self.aux = self._auxs[i]
+        self._head = (i + 1) % self._size
+        self._count -= 1
+        return True
+    
+    def clear(self):
+        """drop everything queued"""
+        self._head = 0
+        self._count = 0
+    
+    def flush(self):
+        """catch up with the current input state without reporting it, e.g. after a blocking screen"""
+        self.poll(self.tag)
+        self.clear()
+    
+    def poll(self, aux=0):
+        """sample the encoder and button, queueing anything that changed"""
+        now = ticks_ms()
+        
+        if self._encoder.update():
+            d = self._encoder.get_delta()
+            if d:
+                self.push(ROTATE, d, now, aux)
+        
+        button = self._button
+        if button.update():
+            if button.pressed:
+                self.push(PRESS, 0, now, aux)
+            if button.long_pressed:
+                self.push(LONG_PRESS, 0, now, aux)
+            if button.released:
+                self.push(RELEASE, 0, now, aux)
@@ -1,16 +1,24 @@
-import time
-import displayio
-import terminalio
-from adafruit_display_text import label
-import digitalio
 import board
-from rotary_encoder import RotaryEncoder
+import asyncio
+from rotary_encoder import create_encoder
+from button import DebouncedButton
+from input_events import InputQueue, ROTATE, PRESS, RELEASE, LONG_PRESS
+from idle import IdleSleeper
+from screens import screens
+import audio
 
 # initialize hardware
-encoder = RotaryEncoder(board.D0, board.D1, pulses_per_detent=4)
+# rotaryio counts edges in hardware when available, polling otherwise
+encoder = create_encoder(board.D0, board.D1, pulses_per_detent=4)
 
-button = digitalio.DigitalInOut(board.D7)
-button.switch_to_input(pull=digitalio.Pull.UP)
+button = DebouncedButton(board.D7)
+
+# every menu and game loop reads input through this queue
+events = InputQueue(encoder, button)
+
+# menus light-sleep after this long without input, woken by the knob or button
+IDLE_TIMEOUT_S = 30
+idle = IdleSleeper((board.D0, board.D1, board.D7), (encoder, button), timeout_s=IDLE_TIMEOUT_S)
 
 pixel_colors = {
     3: (0, 255, 0),
@@ -20,7 +28,32 @@ pixel_colors = {
 }
 
 
-def enter_initials(display, pixel):
+# menus look at the queue this often, the input task samples much faster
+MENU_PERIOD = 0.01
+
+
+async def menu_poll(display=None):
+    """one menu iteration: sleep the board if nothing's happening, then let the other tasks run"""
+    # a sound still playing counts as activity so effects aren't cut off
+    if idle.check(len(events) or audio.sequencer.playing, display):
+        # the turn or press that woke us shouldn't act on the menu
+        events.flush()
+    await asyncio.sleep(MENU_PERIOD)
+
+
+async def wait_for_press(display=None):
+    """block until the button is pressed, keeping sound effects going"""
+    events.flush()
+    idle.touch()
+    while True:
+        await menu_poll(display)
+        
+        while events.pop():
+            if events.kind == PRESS:
+                return
+
+
+async def enter_initials(display, pixel):
     """enter 2-letter initials using rotary encoder"""
     letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 
                'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z']
@@ -29,21 +62,22 @@ def enter_initials(display, pixel):
     current_position = 0  # which letter we're editing (0 or 1)
     current_index = 0  # index in letters list
     
+    def build(screen):
+        screen.add_label(None, "ENTER INITIALS", x=15, y=10)
+        screen.add_label("letter1", "", x=40, y=30, scale=2)
+        screen.add_label("letter2", "", x=70, y=30, scale=2)
+        screen.add_label(None, "Press to confirm", x=8, y=55)
+    
+    screen = screens.get("initials", build)
+    
     def draw():
-        g = displayio.Group()
-        
-        g.append(label.Label(terminalio.FONT, text="ENTER INITIALS", x=15, y=10))
-        
         # show both letters with cursor
         letter1_text = f"{'>' if current_position == 0 else ' '}{initials[0]}{'<' if current_position == 0 else ' '}"
         letter2_text = f"{'>' if current_position == 1 else ' '}{initials[1]}{'<' if current_position == 1 else ' '}"
         
-        g.append(label.Label(terminalio.FONT, text=letter1_text, x=40, y=30, scale=2))
-        g.append(label.Label(terminalio.FONT, text=letter2_text, x=70, y=30, scale=2))
-        
-        g.append(label.Label(terminalio.FONT, text="Press to confirm", x=8, y=55))
-        
-        display.root_group = g
+        screen.set_text("letter1", letter1_text)
+        screen.set_text("letter2", letter2_text)
+        screens.show(display, screen)
     
     # find index of current letter
     current_index = letters.index(initials[current_position])
@@ -52,219 +86,250 @@ def enter_initials(display, pixel):
     pixel[0] = (255, 255, 0)  # Yellow
     
     confirmed = False
+    events.flush()
+    idle.touch()
     
     while not confirmed:
-        # rotate to change letter
-        if encoder.update():
-            d = encoder.get_delta()
-            if d:
-                current_index = (current_index + d) % len(letters)
+        await menu_poll(display)
+        
+        while events.pop() and not confirmed:
+            # rotate to change letter
+            if events.kind == ROTATE:
+                current_index = (current_index + events.value) % len(letters)
                 initials[current_position] = letters[current_index]
                 draw()
-        
-        # button to confirm current letter and move to next
-        if not button.value:
-            time.sleep(0.2)
             
-            if current_position == 0:
-                # move to second letter
-                current_position = 1
-                current_index = letters.index(initials[current_position])
-                draw()
-                
-                # wait for button release
-                while not button.value:
-                    time.sleep(0.1)
-            else:
-                # both letters confirmed
-                confirmed = True
+            # button to confirm current letter and move to next
+            elif events.kind == PRESS:
+                if current_position == 0:
+                    # move to second letter
+                    current_position = 1
+                    current_index = letters.index(initials[current_position])
+                    draw()
+                else:
+                    # both letters confirmed
+                    confirmed = True
     
     return "".join(initials)
 
 
-def show_scoreboard(display, pixel):
+async def show_scoreboard(display, pixel):
     """display the high score leaderboard with mode switching"""
     from high_scores import load_high_scores, MODES
     
     current_mode_index = 0
     
+    def build(screen):
+        # title with current mode
+        screen.add_label("title", "", x=15, y=5)
+        screen.add_label(None, "=" * 16, x=0, y=13)
+        screen.add_label("empty", "No scores yet!", x=15, y=32)
+        
+        # one row per top 3 slot
+        y_pos = 23
+        for i in range(3):
+            screen.add_label(f"score{i}", "", x=5, y=y_pos)
+            screen.add_label(f"diff{i}", "", x=95, y=y_pos)
+            y_pos += 12
+        
+        # instructions
+        screen.add_label(None, "Rotate: Switch", x=10, y=52)
+        screen.add_label(None, "Hold: Return", x=15, y=60)
+    
+    screen = screens.get("scoreboard", build)
+    
     def draw():
         mode = MODES[current_mode_index]
         scores = load_high_scores(mode)
         
-        g = displayio.Group()
-        
-        # title with current mode
-        g.append(label.Label(terminalio.FONT, text=f"{mode} SCORES", x=15, y=5))
-        g.append(label.Label(terminalio.FONT, text="=" * 16, x=0, y=13))
+        screen.set_text("title", f"{mode} SCORES")
+        screen.set_hidden("empty", bool(scores))
         
-        if not scores:
-            g.append(label.Label(terminalio.FONT, text="No scores yet!", x=15, y=32))
-        else:
-            # display top 3 scores
-            y_pos = 23
-            for i, entry in enumerate(scores):
+        # display top 3 scores, hide unused rows
+        for i in range(3):
+            if i < len(scores):
+                entry = scores[i]
                 rank_symbol = ["1ST", "2ND", "3RD"][i]
                 
                 # format: "1ST AA 250 MED"
-                score_text = f"{rank_symbol} {entry['initials']} {entry['score']}"
-                diff_text = entry['difficulty'][:3].upper()
-                
-                g.append(label.Label(terminalio.FONT, text=score_text, x=5, y=y_pos))
-                g.append(label.Label(terminalio.FONT, text=diff_text, x=95, y=y_pos))
-                
-                y_pos += 12
-        
-        # instructions
-        g.append(label.Label(terminalio.FONT, text="Rotate: Switch", x=10, y=52))
-        g.append(label.Label(terminalio.FONT, text="Press: Return", x=12, y=60))
+                screen.set_text(f"score{i}", f"{rank_symbol} {entry['initials']} {entry['score']}")
+                screen.set_text(f"diff{i}", entry['difficulty'][:3].upper())
+                screen.set_hidden(f"score{i}", False)
+                screen.set_hidden(f"diff{i}", False)
+            else:
+                screen.set_hidden(f"score{i}", True)
+                screen.set_hidden(f"diff{i}", True)
         
-        display.root_group = g
+        screens.show(display, screen)
     
     draw()
     pixel[0] = (255, 215, 0)  # Gold
     
     # input loop
+    events.flush()
+    idle.touch()
+    
+    # the press that opened this screen may still be down, so its release or
+    # long press only counts once a press has started here
+    armed = False
     while True:
-        # rotary encoder to switch modes
-        if encoder.update():
-            d = encoder.get_delta()
-            if d:
-                current_mode_index = (current_mode_index + d) % len(MODES)
-                draw()
+        await menu_poll(display)
         
-        # button to return
-        if not button.value:
-            time.sleep(0.2)
-            return
+        while events.pop():
+            # rotary encoder to switch modes
+            if events.kind == ROTATE:
+                current_mode_index = (current_mode_index + events.value) % len(MODES)
+                draw()
+            
+            elif events.kind == PRESS:
+                armed = True
+            
+            # hold to go back
+            elif events.kind == LONG_PRESS and armed:
+                return
+            
+            # a short tap also switches modes, once it's clear it wasn't a hold
+            elif events.kind == RELEASE and armed:
+                armed = False
+                current_mode_index = (current_mode_index + 1) % len(MODES)
+                draw()
 
 
-def main_menu(display, pixel):
+async def main_menu(display, pixel):
     """main menu with Play, Endless, and Scoreboard options"""
     options = ["PLAY", "ENDLESS", "SCOREBOARD"]
     index = 0
     
-    def draw():
-        g = displayio.Group()
-        
+    def build(screen):
         # title
-        g.append(label.Label(terminalio.FONT, text="MAIN MENU", x=25, y=15))
+        screen.add_label(None, "MAIN MENU", x=25, y=15)
         
         # menu options
+        for i, opt in enumerate(options):
+            screen.add_label(f"opt{i}", "  " + opt, x=22, y=32 + i * 12)
+    
+    screen = screens.get("main_menu", build)
+    
+    def draw():
+        # only the selection marker changes
         for i, opt in enumerate(options):
             prefix = "> " if i == index else "  "
-            g.append(label.Label(terminalio.FONT, text=prefix + opt, x=22, y=32 + i * 12))
-        
-        display.root_group = g
+            screen.set_text(f"opt{i}", prefix + opt)
+        screens.show(display, screen)
     
     draw()
     pixel[0] = (0, 255, 255)  # Cyan for menu
     
+    events.flush()
+    idle.touch()
     while True:
-        if encoder.update():
-            d = encoder.get_delta()
-            if d:
-                index = (index + (1 if d > 0 else -1)) % 3
-                draw()
+        await menu_poll(display)
         
-        if not button.value:
-            time.sleep(0.2)
-            return options[index]
+        while events.pop():
+            if events.kind == ROTATE:
+                index = (index + (1 if events.value > 0 else -1)) % 3
+                draw()
+            
+            elif events.kind == PRESS:
+                return options[index]
 
 
-def difficulty_select(display, pixel):
+async def difficulty_select(display, pixel):
     """difficulty selection menu"""
     options = ["EASY", "MEDIUM", "HARD"]
     index = 0
     colors = {"EASY": (0, 255, 0), "MEDIUM": (255, 165, 0), "HARD": (255, 0, 0)}
     
+    def build(screen):
+        screen.add_label(None, "SELECT DIFFICULTY", x=5, y=10)
+        for i, opt in enumerate(options):
+            screen.add_label(f"opt{i}", "  " + opt, x=10, y=30 + i * 12)
+    
+    screen = screens.get("difficulty", build)
+    
     def draw():
-        g = displayio.Group()
-        g.append(label.Label(terminalio.FONT, text="SELECT DIFFICULTY", x=5, y=10))
         for i, opt in enumerate(options):
             prefix = "> " if i == index else "  "
-            g.append(label.Label(terminalio.FONT, text=prefix + opt, x=10, y=30 + i * 12))
-        display.root_group = g
+            screen.set_text(f"opt{i}", prefix + opt)
+        screens.show(display, screen)
     
     draw()
     pixel[0] = colors[options[index]]
     
+    events.flush()
+    idle.touch()
     while True:
-        if encoder.update():
-            d = encoder.get_delta()
-            if d:
-                index = (index + (1 if d > 0 else -1)) % 3
+        await menu_poll(display)
+        
+        while events.pop():
+            if events.kind == ROTATE:
+                index = (index + (1 if events.value > 0 else -1)) % 3
                 pixel[0] = colors[options[index]]
                 draw()
-        
-        if not button.value:
-            time.sleep(0.2)
-            return options[index]
+            
+            elif events.kind == PRESS:
+                return options[index]
 
 
-def game_over_screen(display):
+async def game_over_screen(display):
     """gmme over menu"""
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="GAME OVER", x=20, y=20))
-    g.append(label.Label(terminalio.FONT, text="PLAY AGAIN?", x=20, y=40))
-    g.append(label.Label(terminalio.FONT, text="Press Button", x=15, y=52))
-    display.root_group = g
+    def build(screen):
+        screen.add_label(None, "GAME OVER", x=20, y=20)
+        screen.add_label(None, "PLAY AGAIN?", x=20, y=40)
+        screen.add_label(None, "Press Button", x=15, y=52)
     
-    while True:
-        if not button.value:
-            time.sleep(0.2)
-            return True 
+    screens.show(display, screens.get("game_over", build))
+    
+    await wait_for_press(display)
+    return True
 
 
-def victory_screen(display, score):
+async def victory_screen(display, score):
     """victory screen with score"""
-    g = displayio.Group()
-    
-    g.append(label.Label(
-        terminalio.FONT,
-        text="VICTORY!",
-        x=28, y=12
-    ))
-    
-    g.append(label.Label(
-        terminalio.FONT,
-        text=f"Score: {score}",
-        x=28, y=28
-    ))
-    
-    g.append(label.Label(
-        terminalio.FONT,
-        text="PLAY AGAIN?",
-        x=20, y=45
-    ))
-    
-    g.append(label.Label(
-        terminalio.FONT,
-        text="Press Button",
-        x=15, y=57
-    ))
-    
-    display.root_group = g
+    def build(screen):
+        screen.add_label(None, "VICTORY!", x=28, y=12)
+        screen.add_label("score", "", x=28, y=28)
+        screen.add_label(None, "PLAY AGAIN?", x=20, y=45)
+        screen.add_label(None, "Press Button", x=15, y=57)
     
-    while True:
-        if not button.value:
-            time.sleep(0.2)
-            return True 
+    screen = screens.get("victory", build)
+    screen.set_text("score", f"Score: {score}")
+    screens.show(display, screen)
+    
+    await wait_for_press(display)
+    return True
 
 
-def lose_life(display, pixel, lives):
+async def lose_life(display, pixel, lives):
     """handle losing a life"""
     lives -= 1
     pixel[0] = pixel_colors[lives]
     
     if lives <= 0:
-        restart = game_over_screen(display)
+        restart = await game_over_screen(display)
         return ("RESTART" if restart else "EXIT"), lives
     
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="-1 LIFE", x=40, y=22))
-    g.append(label.Label(terminalio.FONT, text=f"Lives left: {lives}", x=25, y=40))
-    display.root_group = g
-    time.sleep(1.3)
+    def build(screen):
+        screen.add_label(None, "-1 LIFE", x=40, y=22)
+        screen.add_label("lives", "", x=25, y=40)
+    
+    screen = screens.get("lose_life", build)
+    screen.set_text("lives", f"Lives left: {lives}")
+    screens.show(display, screen)
+    await audio.wait(1.3)
     
     return "CONTINUE", lives
+
+
+async def new_high_score_screen(display, pixel, rank):
+    """flash the new high score banner before entering initials"""
+    def build(screen):
+        screen.add_label(None, "NEW HIGH", x=25, y=15, scale=2)
+        screen.add_label(None, "SCORE!", x=30, y=35, scale=2)
+        screen.add_label("rank", "", x=30, y=55)
+    
+    screen = screens.get("new_high_score", build)
+    screen.set_text("rank", f"Rank #{rank}!")
+    screens.show(display, screen)
+    pixel[0] = (255, 215, 0)
+    await audio.wait(2)
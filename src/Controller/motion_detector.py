@@ -0,0 +1,164 @@
+from array import array
+
+# classifications
+STILL = 0
+MOVING = 1
+SHAKE = 2
+TILT = 3
+
+# 32 samples is 320 ms at 100 Hz
+WINDOW = 32
+
+# accelerometer counts are 4 mg, so these are about 0.4 g and 0.2 g (~12 degrees)
+SHAKE_STD = 100
+TILT_COUNTS = 50
+
+# still means within this many times the resting noise energy
+STILL_MARGIN = 10
+
+# bounds on the calibrated noise variance (counts^2), in case the board
+# was handled during calibration or the chip is unusually quiet
+MIN_FLOOR = 4
+MAX_FLOOR = 400
+
+
+class MotionDetector:
+    """
+    Streaming stillness, shake and tilt detection over the last WINDOW samples.
+    Keeps integer running sums and sums of squares per axis in a ring buffer,
+    so each sample costs the same few additions whatever the window size.
+    
+    Energy is the summed per-axis variance of the window, scaled by WINDOW^2 to
+    stay in integers; it catches any movement, including turns that keep the
+    magnitude at 1 g. Tilt compares the window mean to a reference taken with
+    set_reference(), so slow drift that the variance misses still counts.
+    """
+    
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._ring = array("h", [0] * (3 * window))
+        self.noise_floor = MIN_FLOOR
+        self.reset()
+    
+    def reset(self):
+        """empty the window and forget the tilt reference"""
+        ring = self._ring
+        for i in range(len(ring)):
+            ring[i] = 0
+        self._head = 0
+        self.filled = 0
+        self._sx = self._sy = self._sz = 0
+        self._qx = self._qy = self._qz = 0
+        self._ref = None
+    
+    @property
+    def ready(self):
+        """True once the window has a full set of samples"""
+        return self.filled == self.window
+    
+    def push(self, x, y, z):
+        """add one sample, dropping the oldest once the window is full"""
+        ring = self._ring
+        i = self._head
+        if self.filled == self.window:
+            ox = ring[i]
+            oy = ring[i + 1]
+            oz = ring[i + 2]
+            self._sx -= ox
+            self._sy -= oy
+            self._sz -= oz
+            self._qx -= ox * ox
+            self._qy -= oy * oy
+            self._qz -= oz * oz
+        else:
+            self.filled += 1
+        
+        ring[i] = x
+        ring[i + 1] = y
+        ring[i + 2] = z
+        self._sx += x
+        self._sy += y
+        self._sz += z
+        self._qx += x * x
+        self._qy += y * y
+        self._qz += z * z
+        
+        i += 3
+        self._head = 0 if i == len(ring) else i
+    
+    def feed(self, samples, n):
+        """add a block of n x, y, z triples, e.g. straight from FifoAccelerometer"""
+        j = 0
+        for _ in range(n):
+            self.push(samples[j], samples[j + 1], samples[j + 2])
+            j += 3
+    
+    def energy(self):
+        """summed per-axis variance times filled^2"""
+        n = self.filled
+        sx, sy, sz = self._sx, self._sy, self._sz
+        return n * (self._qx + self._qy + self._qz) - (sx * sx + sy * sy + sz * sz)
+    
+    def variance(self):
+        """summed per-axis variance of the window in counts^2"""
+        n = self.filled
+        return self.energy() // (n * n) if n else 0
+    
+    def calibrate(self):
+        """take the current window as the resting noise, call while the board sits still"""
+        floor = self.variance()
+        if floor < MIN_FLOOR:
+            floor = MIN_FLOOR
+        elif floor > MAX_FLOOR:
+            floor = MAX_FLOOR
+        self.noise_floor = floor
+        return floor
+    
+    def set_reference(self):
+        """remember the current window mean, tilt is measured from here"""
+        self._ref = (self._sx, self._sy, self._sz, self.filled) if self.filled else None
+    
+    def mean(self, axis):
+        """window mean of axis (0, 1, 2 for x, y, z) in counts"""
+        n = self.filled
+        if not n:
+            return 0
+        return (self._sx, self._sy, self._sz)[axis] // n
+    
+    def reference(self, axis):
+        """mean of axis when set_reference() was called, the current mean if it wasn't"""
+        if self._ref is None:
+            return self.mean(axis)
+        return self._ref[axis] // self._ref[3]
+    
+    def tilted(self):
+        """True if the window mean has moved more than TILT_COUNTS on any axis since set_reference()"""
+        if self._ref is None or not self.filled:
+            return False
+        rx, ry, rz, rn = self._ref
+        n = self.filled
+        # compare means without dividing: |s/n - r/rn| > t  <=>  |s*rn - r*n| > t*n*rn
+        limit = TILT_COUNTS * n * rn
+        d = self._sx * rn - rx * n
+        if d > limit or d < -limit:
+            return True
+        d = self._sy * rn - ry * n
+        if d > limit or d < -limit:
+            return True
+        d = self._sz * rn - rz * n
+        return d > limit or d < -limit
+    
+    def classify(self):
+        """STILL, MOVING, SHAKE or TILT for the current window"""
+        n = self.filled
+        if not n:
+            return STILL
+        e = self.energy()
+        nn = n * n
+        if e > SHAKE_STD * SHAKE_STD * nn:
+            return SHAKE
+        if self.tilted():
+            return TILT
+        if e > STILL_MARGIN * self.noise_floor * nn:
+            return MOVING
+        return STILL
@@ -0,0 +1,108 @@
+from clock import ticks_ms, ticks_diff
+
+# one physics step covers this many ms, the tuning constants below are per step
+# and were picked at about the rate the old once-per-loop physics ran
+STEP_MS = 20
+
+# angles and speeds are held in 1/256 degree so every step is small-int math
+FRAC_BITS = 8
+FULL_TURN = 360 << FRAC_BITS
+
+ACCEL = 2 << FRAC_BITS          # per detent
+MAX_SPEED = 22 << FRAC_BITS     # per step
+
+# friction is a multiply by FRICTION_MUL / 1024, 1009 / 1024 = 0.9854
+FRICTION_BITS = 10
+FRICTION_MUL = 1009
+
+# after a long stall, catch up at most this many steps and drop the rest
+MAX_STEPS = 5
+
+
+class CursorPhysics:
+    """
+    Cursor spin integrated at a fixed timestep, independent of the frame rate.
+    update() runs however many STEP_MS steps have elapsed since the last call,
+    so a slow refresh makes the cursor jump further, not move slower.
+    
+    Encoder detents go in through push() and are applied on the next step.
+    position and velocity are fixed point (1/256 degree), angle is whole degrees.
+    """
+    
+    def __init__(self, step_ms=STEP_MS):
+        self.step_ms = step_ms
+        self.position = 0
+        self.velocity = 0
+        self.angle = 0
+        self._kick = 0
+        self.resync()
+        
+        # how much physics ran, separately from how many frames were drawn
+        self.steps = 0
+        self.updates = 0
+        self.dropped_ms = 0
+    
+    def resync(self):
+        """forget time spent away, e.g. in a stun animation, so it isn't caught up on"""
+        self._last = ticks_ms()
+        self._accumulator = 0
+    
+    def push(self, detents):
+        """queue encoder movement for the next step"""
+        self._kick += detents
+    
+    def step(self):
+        """advance one fixed step"""
+        velocity = self.velocity + self._kick * ACCEL
+        self._kick = 0
+        
+        if velocity > MAX_SPEED:
+            velocity = MAX_SPEED
+        elif velocity < -MAX_SPEED:
+            velocity = -MAX_SPEED
+        
+        # shift the magnitude so friction slows both directions the same
+        # (a plain >> rounds negatives away from zero and they'd never stop)
+        if velocity >= 0:
+            velocity = (velocity * FRICTION_MUL) >> FRICTION_BITS
+        else:
+            velocity = -((-velocity * FRICTION_MUL) >> FRICTION_BITS)
+        self.velocity = velocity
+        
+        # speed is capped well under a full turn, one wrap is enough
+        position = self.position + velocity
+        if position >= FULL_TURN:
+            position -= FULL_TURN
+        elif position < 0:
+            position += FULL_TURN
+        self.position = position
+        self.angle = position >> FRAC_BITS
+    
+    def update(self):
+        """run the steps due since the last call, returns how many ran"""
+        now = ticks_ms()
+        self._accumulator += ticks_diff(now, self._last)
+        self._last = now
+        self.updates += 1
+        
+        n = 0
+        while self._accumulator >= self.step_ms:
+            if n == MAX_STEPS:
+                # too far behind, drop the backlog rather than spiral
+                self.dropped_ms += self._accumulator
+                self._accumulator = 0
+                break
+            self._accumulator -= self.step_ms
+            self.step()
+            n += 1
+        
+        self.steps += n
+        return n
+    
+    def stats(self):
+        """steps run, update() calls and time dropped while catching up"""
+        return {
+            "steps": self.steps,
+            "updates": self.updates,
+            "dropped_ms": self.dropped_ms,
+        }
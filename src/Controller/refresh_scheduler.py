@@ -0,0 +1,88 @@
+import time
+from clock import ticks_ms, ticks_add, ticks_diff
+
+# what changed since the last pushed frame
+CURSOR = 1
+LABELS = 2
+DIAL = 4
+ALL = CURSOR | LABELS | DIAL
+
+
+class RefreshScheduler:
+    """
+    Pushes display frames only when something changed, capped at a target fps.
+    While started, auto refresh is off and this is the only thing talking to the
+    display, which leaves the shared I2C bus free for the accelerometer.
+    
+    The cap is a deadline that moves on by interval_ms per push, and a refresh up
+    to a quarter frame early still goes out, so a caller paced on interval_ms
+    lands on every frame despite timer jitter.
+    """
+    
+    def __init__(self, display, fps=30):
+        self.display = display
+        self._dirty = 0
+        self._active = False
+        self._next_push = ticks_ms()
+        self.set_fps(fps)
+        self.reset_stats()
+    
+    def set_fps(self, fps):
+        """change the refresh cap"""
+        self.fps = fps
+        self.interval_ms = 1000 // fps
+        self._slack_ms = self.interval_ms // 4
+    
+    def reset_stats(self):
+        """zero the frame and bus time counters"""
+        self.frames_pushed = 0
+        self.frames_skipped = 0
+        self.bus_time_ns = 0
+    
+    def start(self):
+        """take over refreshing, the next refresh pushes a full frame"""
+        self.display.auto_refresh = False
+        self._active = True
+        self._next_push = ticks_ms()
+        self.mark(ALL)
+    
+    def stop(self):
+        """hand refreshing back to displayio, e.g. before a blocking screen"""
+        if self._active:
+            self._active = False
+            self.display.auto_refresh = True
+    
+    def mark(self, what=ALL):
+        """flag part of the screen as changed"""
+        self._dirty |= what
+    
+    def refresh(self):
+        """push a frame if anything changed and the fps cap allows it, returns True if pushed"""
+        if not self._dirty:
+            self.frames_skipped += 1
+            return False
+        
+        now = ticks_ms()
+        if ticks_diff(self._next_push, now) > self._slack_ms:
+            self.frames_skipped += 1
+            return False
+        
+        start = time.monotonic_ns()
+        try:
+            pushed = self.display.refresh(minimum_frames_per_second=0)
+        except Exception:
+            pushed = False
+        if pushed is False:
+            # displayio declined, still dirty so try again next call
+            self.frames_skipped += 1
+            return False
+        done = time.monotonic_ns()
+        
+        self._next_push = ticks_add(self._next_push, self.interval_ms)
+        if ticks_diff(self._next_push, now) <= 0:
+            # fell more than a frame behind, don't let pushes bunch up to catch up
+            self._next_push = ticks_add(now, self.interval_ms)
+        self._dirty = 0
+        self.frames_pushed += 1
+        self.bus_time_ns += done - start
+        return True
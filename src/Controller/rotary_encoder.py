@@ -1,40 +1,58 @@
-import time
 import digitalio
+from array import array
+from clock import ticks_ms, ticks_diff
+
+try:
+    import rotaryio
+except ImportError:
+    rotaryio = None
 
 class RotaryEncoder:
 
-    _TRANSITION_TABLE = {
-        0b0001: +1,  # CW: 00 -> 01
-        0b0111: +1,  # CW: 01 -> 11
-        0b1110: +1,  # CW: 11 -> 10
-        0b1000: +1,  # CW: 10 -> 00
-        
-        0b0010: -1,  # CCW: 00 -> 10
-        0b1011: -1,  # CCW: 10 -> 11
-        0b1101: -1,  # CCW: 11 -> 01
-        0b0100: -1,  # CCW: 01 -> 00
-    }
+    # movement indexed by (prev_state << 2) | curr_state
+    # 0 on the diagonal is no change, the other zeros are illegal jumps where
+    # both pins changed between samples, meaning a state was skipped
+    _TRANSITION_TABLE = array("b", [
+         0, +1, -1,  0,  # from 00: CW -> 01, CCW -> 10
+        -1,  0,  0, +1,  # from 01: CCW -> 00, CW -> 11
+        +1,  0,  0, -1,  # from 10: CW -> 00, CCW -> 11
+         0, -1, +1,  0,  # from 11: CCW -> 01, CW -> 10
+    ])
     
     def __init__(self, pin_a, pin_b, *, pull=digitalio.Pull.UP, pulses_per_detent=4):
-        self._a = digitalio.DigitalInOut(pin_a)
-        self._a.switch_to_input(pull=pull)
-        self._b = digitalio.DigitalInOut(pin_b)
-        self._b.switch_to_input(pull=pull)
+        self._pins = (pin_a, pin_b)
+        self._pull = pull
+        self.resume()
         
         self._pulses_per_detent = pulses_per_detent
         
         # state tracking
-        self._last_state = self._read_state()
         self._raw_pos = 0
         self._detent_pos = 0
         self._delta = 0
         
-        # smoothing- accumulate small movements
-        self._accumulated = 0
-        
         # debouncing
-        self._last_update_time = time.monotonic()
-        self._min_interval = 0.001  # 1ms minimum between updates
+        self._last_update_time = ticks_ms()
+        self._min_interval = 1  # 1ms minimum between updates
+        
+        # diagnostics
+        self._last_sample_time = self._last_update_time
+        self.reset_diagnostics()
+    
+    def resume(self):
+        """claim the pins, e.g. again after suspend()"""
+        self._a = digitalio.DigitalInOut(self._pins[0])
+        self._a.switch_to_input(pull=self._pull)
+        self._b = digitalio.DigitalInOut(self._pins[1])
+        self._b.switch_to_input(pull=self._pull)
+        
+        # whatever the knob did while released isn't a step
+        self._last_state = self._read_state()
+    
+    def suspend(self):
+        """release the pins so they can be used as wake alarms, position is kept"""
+        self._a.deinit()
+        self._b.deinit()
     
     def _read_state(self):
         return (self._a.value << 1) | self._b.value
@@ -44,10 +62,16 @@ class RotaryEncoder:
         Update encoder state. Returns True if position changed.
         Call this frequently in your main loop.
         """
-        now = time.monotonic()
+        now = ticks_ms()
+        
+        # longest time between samples shows when the loop is too slow to track the encoder
+        gap = ticks_diff(now, self._last_sample_time)
+        self._last_sample_time = now
+        if gap > self.worst_gap:
+            self.worst_gap = gap
         
         # debounce: ignore updates that are too fast
-        if (now - self._last_update_time) < self._min_interval:
+        if ticks_diff(now, self._last_update_time) < self._min_interval:
             return False
         
         curr_state = self._read_state()
@@ -60,14 +84,17 @@ class RotaryEncoder:
         transition = (self._last_state << 2) | curr_state
         
         # look up movement direction
-        move = self._TRANSITION_TABLE.get(transition, 0)
+        move = self._TRANSITION_TABLE[transition]
         
         # update state regardless of valid transition
         self._last_state = curr_state
         self._last_update_time = now
         
-        # valid transition detected
-        if move != 0:
+        if move == 0:
+            # state changed but not to a neighbour, at least one edge was missed
+            self.illegal_edges += 1
+        else:
+            self.edges += 1
             self._raw_pos += move
             
             # check if we've completed a detent
@@ -100,3 +127,110 @@ class RotaryEncoder:
         self._raw_pos = 0
         self._detent_pos = 0
         self._delta = 0
+    
+    def reset_diagnostics(self):
+        """zero the edge counters and worst sample gap"""
+        self.edges = 0
+        self.illegal_edges = 0
+        self.worst_gap = 0
+        self._last_sample_time = ticks_ms()
+    
+    def diagnostics(self):
+        """
+        edge counts and the worst gap between update() calls in milliseconds.
+        illegal edges climbing means the loop is too slow for the encoder.
+        """
+        return {
+            "edges": self.edges,
+            "illegal": self.illegal_edges,
+            "worst_gap_ms": self.worst_gap,
+        }
+
+
+class HardwareRotaryEncoder:
+    """
+    Same API as RotaryEncoder, but edges are counted by rotaryio in the
+    background, so nothing is lost while the main loop is busy.
+    """
+    
+    def __init__(self, pin_a, pin_b, *, pulses_per_detent=4):
+        self._pins = (pin_a, pin_b)
+        self._divisor = pulses_per_detent
+        self._detent_pos = 0
+        self._delta = 0
+        self.resume()
+    
+    def resume(self):
+        """claim the pins, e.g. again after suspend(), carrying on from the same position"""
+        # swapped so 00 -> 01 counts forwards like the polling decoder, on the
+        # assumption that rotaryio counts it backwards; not checked on the board yet
+        self._encoder = rotaryio.IncrementalEncoder(self._pins[1], self._pins[0], divisor=self._divisor)
+        self._offset = self._encoder.position - self._detent_pos
+    
+    def suspend(self):
+        """release the pins so they can be used as wake alarms, position is kept"""
+        self._encoder.deinit()
+    
+    def update(self):
+        """
+        Pick up detents counted since the last call. Returns True if position changed.
+        """
+        pos = self._encoder.position - self._offset
+        if pos == self._detent_pos:
+            return False
+        self._delta += pos - self._detent_pos
+        self._detent_pos = pos
+        return True
+    
+    def get_delta(self):
+        """
+        get accumulated movement since last call.
+        returns +N for clockwise, -N for counter-clockwise.
+        """
+        delta = self._delta
+        self._delta = 0
+        return delta
+    
+    def get_position(self):
+        """get absolute detent position"""
+        return self._detent_pos
+    
+    def reset(self):
+        """reset position to zero"""
+        self._offset = self._encoder.position
+        self._detent_pos = 0
+        self._delta = 0
+    
+    def reset_diagnostics(self):
+        """nothing to reset, kept for the same API as RotaryEncoder"""
+        pass
+    
+    def diagnostics(self):
+        """rotaryio catches every edge itself and doesn't expose a count, so all zeros"""
+        return {"edges": 0, "illegal": 0, "worst_gap_ms": 0}
+    
+    def deinit(self):
+        """release the pins"""
+        self.suspend()
+
+
+def create_encoder(pin_a, pin_b, *, backend="polling", pull=digitalio.Pull.UP, pulses_per_detent=4):
+    """
+    build an encoder on the given pins.
+    backend is "polling" (RotaryEncoder), "hardware" (rotaryio) or "auto",
+    which uses rotaryio when the board has it and falls back to polling.
+    polling is the default until the rotaryio pin order has been checked on
+    the board; with it swapped, clockwise would count backwards.
+    """
+    if backend == "auto":
+        backend = "hardware" if rotaryio is not None else "polling"
+    
+    if backend == "hardware":
+        if rotaryio is None:
+            raise RuntimeError("rotaryio not available on this board")
+        return HardwareRotaryEncoder(pin_a, pin_b, pulses_per_detent=pulses_per_detent)
+    
+    if backend == "polling":
+        return RotaryEncoder(pin_a, pin_b, pull=pull, pulses_per_detent=pulses_per_detent)
+    
+    raise ValueError(f"unknown encoder backend: {backend}")
@@ -1,4 +1,5 @@
 import time
+import asyncio
 from adafruit_ble import BLERadio
 from adafruit_ble.services.nordic import UARTService
 
@@ -6,23 +7,35 @@ ble = BLERadio()
 uart_connection = None
 uart_service = None
 
-def connect_to_safe():
+# commands waiting for link_task() to send them
+_pending = []
+
+# scan in short bursts so the other tasks get to run in between
+SCAN_SLICE = 0.5
+
+async def connect_to_safe(timeout=10):
     """connect to the VaultSafe"""
     global uart_connection, uart_service
     
     print("scanning for VaultSafe...")
     
-    for adv in ble.start_scan(timeout=10):
-        if adv.complete_name == "VaultSafe":
-            print("Found VaultSafe! Connecting...")
-            try:
-                uart_connection = ble.connect(adv)
-                print("Connected!")
-                break
-            except Exception as e:
-                print(f"Connection failed: {e}")
-    
-    ble.stop_scan()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for adv in ble.start_scan(timeout=SCAN_SLICE):
+            if adv.complete_name == "VaultSafe":
+                print("Found VaultSafe! Connecting...")
+                try:
+                    uart_connection = ble.connect(adv)
+                    print("Connected!")
+                    break
+                except Exception as e:
+                    print(f"Connection failed: {e}")
+        
+        ble.stop_scan()
+        # a connection left over from an earlier game may have dropped, keep scanning
+        if uart_connection and uart_connection.connected:
+            break
+        await asyncio.sleep(0)
     
     if not uart_connection or not uart_connection.connected:
         print("Failed to connect to VaultSafe")
@@ -37,7 +50,7 @@ def connect_to_safe():
         print(f"UART service failed: {e}")
         return False
 
-def send_command(command):
+async def send_command(command):
     """Send command to safe"""
     global uart_connection, uart_service
     
@@ -54,7 +67,7 @@ def send_command(command):
         print(f"Sent: {command}")
         
         # Wait for response
-        time.sleep(0.2)
+        await asyncio.sleep(0.2)
         if uart_service.in_waiting:
             response = uart_service.read(uart_service.in_waiting).decode('utf-8').strip()
             print(f"Response: {response}")
@@ -65,18 +78,33 @@ def send_command(command):
         print(f"Send failed: {e}")
         return False
 
+def queue_command(command):
+    """hand a command to link_task() without waiting for it, False if there's no safe"""
+    if not uart_connection or not uart_connection.connected:
+        print("Not connected to safe")
+        return False
+    _pending.append(command)
+    return True
+
+async def link_task(period=0.05):
+    """send queued commands one at a time in the background"""
+    while True:
+        while _pending:
+            await send_command(_pending.pop(0))
+        await asyncio.sleep(period)
+
 def lock_safe():
     """Lock the safe"""
-    return send_command("LOCK")
+    return queue_command("LOCK")
 
 def unlock_safe():
     """Unlock the safe"""
-    return send_command("UNLOCK")
+    return queue_command("UNLOCK")
 
-def get_safe_status():
+async def get_safe_status():
     """Get current safe status"""
-    if send_command("STATUS"):
-        time.sleep(0.2)
+    if await send_command("STATUS"):
+        await asyncio.sleep(0.2)
         if uart_service and uart_service.in_waiting:
             response = uart_service.read(uart_service.in_waiting).decode('utf-8').strip()
             return response
@@ -0,0 +1,80 @@
+import displayio
+import terminalio
+from adafruit_display_text import label, bitmap_label
+
+
+class Screen:
+    """a group that is built once, with named labels that are updated in place"""
+    
+    def __init__(self, manager):
+        self._manager = manager
+        self.group = displayio.Group()
+        self.labels = {}
+    
+    def add_label(self, name, text, x, y, scale=1):
+        """add a label, pass name=None for text that never changes"""
+        # static text is rendered once into a single bitmap instead of a tilegrid per glyph
+        font_label = label if name is not None else bitmap_label
+        lbl = font_label.Label(terminalio.FONT, text=text, x=x, y=y, scale=scale)
+        self.group.append(lbl)
+        if name is not None:
+            self.labels[name] = lbl
+        return lbl
+    
+    def set_text(self, name, text):
+        """change a label's text, skipping the rebuild if it's already showing that"""
+        lbl = self.labels[name]
+        if lbl.text == text:
+            self._manager.allocations_avoided += 1
+            return False
+        lbl.text = text
+        return True
+    
+    def set_hidden(self, name, hidden):
+        """show or hide a label without removing it"""
+        self.labels[name].hidden = hidden
+
+
+class ScreenManager:
+    """
+    Keeps every menu and message screen alive after the first time it's built.
+    Showing a screen again reuses its Group and Labels, so navigating menus
+    doesn't create new display objects or fragment the heap.
+    """
+    
+    def __init__(self):
+        self._screens = {}
+        self.screens_built = 0
+        self.screens_reused = 0
+        self.allocations_avoided = 0
+    
+    def get(self, name, build):
+        """return the screen called name, calling build(screen) the first time"""
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = Screen(self)
+            build(screen)
+            self._screens[name] = screen
+            self.screens_built += 1
+        else:
+            # one Group plus every Label would have been created again
+            self.screens_reused += 1
+            self.allocations_avoided += 1 + len(screen.group)
+        return screen
+    
+    def show(self, display, screen):
+        """make screen the root group if it isn't already"""
+        if display.root_group is not screen.group:
+            display.root_group = screen.group
+    
+    def stats(self):
+        """counters as a dict, handy for printing"""
+        return {
+            "built": self.screens_built,
+            "reused": self.screens_reused,
+            "avoided": self.allocations_avoided,
+        }
+
+
+# shared by every module that draws menus or message screens
+screens = ScreenManager()
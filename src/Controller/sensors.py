@@ -1,12 +1,11 @@
 import displayio
 import board
 import busio
-import time
-from adafruit_display_text import label
+import asyncio
 import i2cdisplaybus
 import adafruit_displayio_ssd1306
-import adafruit_adxl34x
-import terminalio
+from accel_fifo import FifoAccelerometer, SINGLE_TAP, DOUBLE_TAP
+from motion_detector import MotionDetector
 
 displayio.release_displays()
 
@@ -14,51 +13,76 @@ i2c = busio.I2C(board.SCL, board.SDA)
 display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
 display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=128, height=64)
 
-accel = adafruit_adxl34x.ADXL345(i2c)
+# samples queue up in the chip's FIFO, accel_sampler() drains them in blocks
+ACCEL_RATE = 100
+accel = FifoAccelerometer(i2c, rate=ACCEL_RATE)
+accel.enable_taps()
 
 
-def run_stay_still_event(main_group):
-    """random event: player must stay still"""
-    # warning screen
-    warn = displayio.Group()
-    warn.append(label.Label(terminalio.FONT, text="EVENT!", x=40, y=18))
-    warn.append(label.Label(terminalio.FONT, text="STAY STILL IN 1s", x=5, y=38))
-    display.root_group = warn
-    time.sleep(1)
-    
-    still = displayio.Group()
-    still.append(label.Label(terminalio.FONT, text="STAY STILL!", x=25, y=25))
-    display.root_group = still
-    
-    # baseline accelerometer reading
-    readings = []
-    for _ in range(5):
-        readings.append(accel.acceleration)
-        time.sleep(0.02)
-    
-    # average the baseline
-    avg_x = sum(r[0] for r in readings) / len(readings)
-    avg_y = sum(r[1] for r in readings) / len(readings)
-    avg_z = sum(r[2] for r in readings) / len(readings)
-    
-    prev_x, prev_y, prev_z = avg_x, avg_y, avg_z
-    
-    # increased threshold, more forgiving
-    THRESH = 1.0 
-    FAILED = False
-    start = time.monotonic()
-    
-    # sample less frequently to be more forgiving
-    while time.monotonic() - start < 3:
-        x, y, z = accel.acceleration
+# latest accelerometer sample in counts (4 mg each), kept fresh by accel_sampler()
+# while a gesture event runs
+motion = [0, 0, 0]
+
+# stillness, shake and tilt over the last few hundred ms, for gesture events
+detector = MotionDetector()
+
+# single and double taps the chip has detected, counted by accel_sampler()
+taps = [0, 0]
+
+# called as listener(samples, n) with every block drained from the FIFO
+motion_listeners = [detector.feed]
+
+
+async def accel_sampler(event, period=0.1):
+    """
+    drain the accelerometer FIFO in the background, a block per wake-up,
+    only while event (a GestureEvent) is active. between events the chip keeps
+    overwriting its FIFO and the shared bus is left to the display.
+    at 100 Hz the FIFO holds 320 ms, so period has to stay well under that.
+    """
+    samples = accel.samples
+    draining = False
+    while True:
+        await asyncio.sleep(period)
+        if not event.active:
+            draining = False
+            continue
         
-        # check if movement exceeds threshold
-        if abs(x - prev_x) > THRESH or abs(y - prev_y) > THRESH or abs(z - prev_z) > THRESH:
-            FAILED = True
-            break
+        if not draining:
+            # whatever piled up since the last event is stale, start the window
+            # over; the event's warning gives it time to fill before the watch
+            draining = True
+            accel.clear()
+            detector.reset()
+            if accel.taps_enabled:
+                accel.interrupt_source()
+            continue
         
-        prev_x, prev_y, prev_z = x, y, z
-        time.sleep(0.1)  # changed from 0.05 to 0.1 (sample half as often)
-    
-    display.root_group = main_group
-    return "FAIL" if FAILED else "SUCCESS"
+        n = accel.read_block()
+        if n:
+            j = 3 * (n - 1)
+            motion[0] = samples[j]
+            motion[1] = samples[j + 1]
+            motion[2] = samples[j + 2]
+            for listener in motion_listeners:
+                listener(samples, n)
+        if accel.taps_enabled:
+            # one byte read, the chip latches taps until INT_SOURCE is read
+            source = accel.interrupt_source()
+            if source & SINGLE_TAP:
+                taps[0] += 1
+            if source & DOUBLE_TAP:
+                taps[1] += 1
+
+
+async def calibrate_motion(seconds=1.0, period=0.1):
+    """measure the resting noise floor for detector, run at boot while the controller sits still"""
+    detector.reset()
+    accel.clear()  # throw away whatever piled up before
+    for _ in range(int(seconds / period)):
+        await asyncio.sleep(period)
+        detector.feed(accel.samples, accel.read_block())
+    floor = detector.calibrate()
+    print(f"[SENSORS] motion noise floor {floor}")
+    detector.reset()
+    return floor
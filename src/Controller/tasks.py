@@ -0,0 +1,34 @@
+import asyncio
+import audio
+from input_handler import events
+
+# how often the session-wide tasks wake, in seconds
+INPUT_PERIOD = 0.002
+AUDIO_PERIOD = 0.005
+
+
+async def input_sampler(queue=events, period=INPUT_PERIOD):
+    """sample the encoder and button into the queue, stamping events with queue.tag"""
+    while True:
+        queue.poll(queue.tag)
+        await asyncio.sleep(period)
+
+
+async def audio_sequencer(period=AUDIO_PERIOD):
+    """chain notes of the playing effect while everything else runs"""
+    while True:
+        audio.tick()
+        await asyncio.sleep(period)
+
+
+def start_background():
+    """
+    start the tasks that live for the whole session: input, audio and the safe link.
+    physics, rendering and the accelerometer only run during a round (see Engine).
+    """
+    from safe_control import link_task
+    return [
+        asyncio.create_task(input_sampler()),
+        asyncio.create_task(audio_sequencer()),
+        asyncio.create_task(link_task()),
+    ]
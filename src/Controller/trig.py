@@ -0,0 +1,20 @@
+"""
+integer sine/cosine lookup tables
+all polar screen geometry goes through here so nothing does float trig per frame
+"""
+
+from array import array
+import math
+
+# table values are fixed-point with 14 fractional bits
+SHIFT = 14
+ONE = 1 << SHIFT
+
+# one entry per degree, built once at import
+_SIN = array("h", [int(round(math.sin(math.radians(a)) * ONE)) for a in range(360)])
+
+
+def polar(cx, cy, r, a):
+    """converts center, radius and angle in degrees to integer x,y screen coordinates"""
+    a = int(a) % 360
+    return cx + ((r * _SIN[(a + 90) % 360]) >> SHIFT), cy + ((r * _SIN[a]) >> SHIFT)
@@ -1,28 +1,6 @@
 import displayio
-import math
-
-def polar(cx, cy, r, a):
-    """converts x,y distance from center, radius, and angle to calculate x,y coordinates to place pixel"""
-    rad = math.radians(a)
-    return int(cx + r * math.cos(rad)), int(cy + r * math.sin(rad))
-
-
-# sets white as only color reference, saves memory
-_shared_palette = None
-
-def _get_shared_palette():
-    global _shared_palette
-    if _shared_palette is None:
-        _shared_palette = displayio.Palette(1)
-        _shared_palette[0] = 0xFFFFFF
-    return _shared_palette
-
-
-def make_pixel(x, y):
-    """Create a single white pixel"""
-    bmp = displayio.Bitmap(1, 1, 1)
-    pal = _get_shared_palette()
-    return displayio.TileGrid(bmp, pixel_shader=pal, x=x, y=y)
+from trig import polar
+from zones import ZONE_BYTES
 
 
 # calculate once to see where the large circle would be placed
@@ -40,33 +18,158 @@ def _get_circle_positions():
     return _circle_positions
 
 
-def draw_circle_and_arc(bg_group, start, end):
-    """draw the central circular and success zone arc"""
-    cx, cy = 64, 40
-    radius = 22
+# arc pixel for every degree, one x and one y table per arc radius
+_arc_xs = None
+_arc_ys = None
+
+def _get_arc_tables():
+    global _arc_xs, _arc_ys
+    if _arc_xs is None:
+        cx, cy = 64, 40
+        radius = 22
+        _arc_xs = []
+        _arc_ys = []
+        for r in (radius, radius - 1):
+            xs = bytearray(360)
+            ys = bytearray(360)
+            for a in range(360):
+                xs[a], ys[a] = polar(cx, cy, r, a)
+            _arc_xs.append(xs)
+            _arc_ys.append(ys)
+    return _arc_xs, _arc_ys
+
+
+# one persistent 1-bit bitmap the whole dial is drawn into
+SCREEN_WIDTH = 128
+SCREEN_HEIGHT = 64
+
+_canvas = None
+_canvas_grid = None
+_canvas_parent = None
+
+def get_canvas():
+    """returns the shared background bitmap, created on first use"""
+    global _canvas, _canvas_grid
+    if _canvas is None:
+        _canvas = displayio.Bitmap(SCREEN_WIDTH, SCREEN_HEIGHT, 2)
+        pal = displayio.Palette(2)
+        pal[0] = 0x000000
+        pal[1] = 0xFFFFFF
+        pal.make_transparent(0)
+        _canvas_grid = displayio.TileGrid(_canvas, pixel_shader=pal)
+    return _canvas
+
+
+def attach_canvas(group):
+    """show the canvas in group, moving it out of the last group it was in"""
+    global _canvas_parent
+    get_canvas()
+    if _canvas_parent is group:
+        return
+    if _canvas_parent is not None:
+        try:
+            _canvas_parent.remove(_canvas_grid)
+        except ValueError:
+            pass
+    group.append(_canvas_grid)
+    _canvas_parent = group
+
+
+class Dial:
+    """dial renderer that remembers which zone mask it last drew"""
     
-    # clear screen
-    while len(bg_group) > 0:
-        bg_group.pop()
+    def __init__(self):
+        self._bmp = get_canvas()
+        self._drawn = bytearray(ZONE_BYTES)
+        
+        # one bit per screen pixel, set where the static circle sits so
+        # erasing an arc pixel never punches a hole in the circle
+        self._static = bytearray(SCREEN_WIDTH * SCREEN_HEIGHT // 8)
+        for x, y in _get_circle_positions():
+            i = y * SCREEN_WIDTH + x
+            self._static[i >> 3] |= 1 << (i & 7)
     
-    # draw circle
-    for x, y in _get_circle_positions():
-        bg_group.append(make_pixel(x, y))
+    def _static_at(self, x, y):
+        i = y * SCREEN_WIDTH + x
+        return (self._static[i >> 3] >> (i & 7)) & 1
     
-    # draw arc
-    if start < end:
-        angles = range(start, end, 3)
-    else:
-        angles = list(range(start, 360, 3)) + list(range(0, end, 3))
+    def redraw(self, mask):
+        """clear the canvas and draw the circle and every zone in mask from scratch"""
+        bmp = self._bmp
+        bmp.fill(0)
+        drawn = self._drawn
+        for i in range(ZONE_BYTES):
+            drawn[i] = 0
+        
+        for x, y in _get_circle_positions():
+            bmp[x, y] = 1
+        
+        self._light(mask)
     
-    for r in (radius, radius - 1):
-        for a in angles:
-            x, y = polar(cx, cy, r, a)
-            bg_group.append(make_pixel(x, y))
+    def set_zone(self, mask):
+        """move to a new zone mask, touching only pixels of the old and new zones"""
+        arc_xs, arc_ys = _get_arc_tables()
+        drawn = self._drawn
+        
+        # erase degrees that only belonged to the old zones
+        for i in range(ZONE_BYTES):
+            gone = drawn[i] & ~mask[i]
+            if gone:
+                for b in range(8):
+                    if (gone >> b) & 1:
+                        self._erase((i << 3) + b, arc_xs, arc_ys)
+        
+        self._light(mask)
+    
+    def _erase(self, a, arc_xs, arc_ys):
+        bmp = self._bmp
+        for i in range(len(arc_xs)):
+            x = arc_xs[i][a]
+            y = arc_ys[i][a]
+            bmp[x, y] = self._static_at(x, y)
+    
+    def _light(self, mask):
+        # every degree of the mask is drawn so the arc matches the hit test exactly;
+        # neighbouring degrees share pixels, so only pixels that are off get written
+        arc_xs, arc_ys = _get_arc_tables()
+        drawn = self._drawn
+        for i in range(ZONE_BYTES):
+            bits = mask[i]
+            drawn[i] = bits
+            if bits:
+                for b in range(8):
+                    if (bits >> b) & 1:
+                        self._light_angle((i << 3) + b, arc_xs, arc_ys)
+    
+    def _light_angle(self, a, arc_xs, arc_ys):
+        bmp = self._bmp
+        for i in range(len(arc_xs)):
+            x = arc_xs[i][a]
+            y = arc_ys[i][a]
+            if not bmp[x, y]:
+                bmp[x, y] = 1
+
+
+_dial = None
+
+def draw_circle_and_arc(bg_group, mask):
+    """draw the central circle and the success zone arcs in mask"""
+    global _dial
+    if _dial is None:
+        _dial = Dial()
+    
+    # a new background group means a fresh level, so draw everything once;
+    # after that only the arcs move
+    if _canvas_parent is not bg_group:
+        attach_canvas(bg_group)
+        _dial.redraw(mask)
+    else:
+        _dial.set_zone(mask)
 
 
 def build_cursor(fg_group):
     """define the cursor sprite shape"""
+    global _cursor_index
     pattern = [
         "0001000",
         "0011100",
@@ -93,13 +196,42 @@ def build_cursor(fg_group):
     
     cursor = displayio.TileGrid(bmp, pixel_shader=pal)
     fg_group.append(cursor)
+    
+    # new sprite starts at 0,0 so the next update always places it
+    _cursor_index = -1
     return cursor
 
 
+# cursor ring around (64, 38) with radius 16, stored as tilegrid x,y for
+# every whole degree so the game loop never calls polar()
+_CURSOR_X = bytearray(360)
+_CURSOR_Y = bytearray(360)
+
+def _build_cursor_ring():
+    for a in range(360):
+        x, y = polar(64, 38, 16, a)
+        _CURSOR_X[a] = x - 3
+        _CURSOR_Y[a] = y - 3
+
+_build_cursor_ring()
+
+# last quantized angle the cursor was placed at
+_cursor_index = -1
+
+
 def update_cursor_rotation(cursor, angle):
-    """update cursor position based on angle as it moves along the circle"""
-    cx, cy = 64, 38
-    r = 16
-    x, y = polar(cx, cy, r, angle)
-    cursor.x = x - 3
-    cursor.y = y - 3
+    """update cursor position based on angle as it moves along the circle, returns True if it moved"""
+    global _cursor_index
+    a = int(angle) % 360
+    if a == _cursor_index:
+        return False
+    _cursor_index = a
+    
+    x = _CURSOR_X[a]
+    y = _CURSOR_Y[a]
+    # neighbouring degrees often share a pixel, don't dirty the display for those
+    if cursor.x == x and cursor.y == y:
+        return False
+    cursor.x = x
+    cursor.y = y
+    return True
@@ -0,0 +1,30 @@
+# success zones as a 360-bit mask, one bit per whole degree
+ZONE_BYTES = 45
+
+
+def new_mask():
+    """an empty zone mask"""
+    return bytearray(ZONE_BYTES)
+
+
+def clear(mask):
+    """empty the mask in place"""
+    for i in range(ZONE_BYTES):
+        mask[i] = 0
+
+
+def add_span(mask, start, width):
+    """set start..start+width inclusive, wrapping past 359; overlapping spans just merge"""
+    if width >= 359:
+        width = 359
+    a = start % 360
+    for _ in range(width + 1):
+        mask[a >> 3] |= 1 << (a & 7)
+        a += 1
+        if a == 360:
+            a = 0
+
+
+def contains(mask, angle):
+    """True if the whole-degree angle (0-359) is in a zone"""
+    return (mask[angle >> 3] >> (angle & 7)) & 1 == 1
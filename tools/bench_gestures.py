@@ -0,0 +1,69 @@
+"""
+Every registered gesture against synthetic traces: which ones pass, fail or
+time out, and what each stage's check() costs per rules loop tick.
+Time is simulated at 10 ms a tick, with one sample per tick.
+"""
+
+import random
+
+import hostenv
+from hostenv import best_ns
+import gestures
+from gestures import GestureEvent, registry, WATCHING
+from motion_detector import MotionDetector
+from motion_traces import sample
+
+CASES = (
+    ("still", "still"), ("still", "fidget"),
+    ("shake", "shake"), ("shake", "still"),
+    ("tilt_right", "tilt_right"), ("tilt_right", "tilt_left"), ("tilt_left", "tilt_left"),
+    ("flip", "flip"), ("flip", "tilt_right"),
+    ("tap", "tap"), ("tap", "still"),
+)
+
+
+def play(name, kind):
+    """run one event against a trace, returns (passed, ms from start)"""
+    detector = MotionDetector()
+    detector.noise_floor = 8
+    taps = [0, 0]
+    results = []
+    event = GestureEvent(detector, taps, results.append)
+    for i in range(32):
+        detector.push(*sample("still", i, 300))
+    
+    event.start(registry.get(name), 0)
+    now = i = 0
+    while event.active and now < 6000:
+        now += 10
+        event.tick(now)
+        if event.state == WATCHING:
+            detector.push(*sample("still" if kind == "tap" else kind, i, 300))
+            i += 1
+            if kind == "tap" and i == 50:
+                taps[1] += 1
+        else:
+            detector.push(*sample("still", 0, 300))
+    return results[0], now
+
+
+def main():
+    random.seed(2)
+    for name, kind in CASES:
+        passed, ms = play(name, kind)
+        print(f"{name:10s} vs {kind:10s} {'pass' if passed else 'fail'} at {ms} ms")
+    
+    detector = MotionDetector()
+    detector.noise_floor = 8
+    for i in range(64):
+        detector.push(*sample("still", i, 64))
+    detector.set_reference()
+    event = GestureEvent(detector, [0, 0], lambda passed: None)
+    for name in registry.names():
+        stage = registry.get(name)
+        stage.begin(event)
+        print(f"check() {name:10s} {best_ns(lambda: stage.check(event), 20_000):5.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Cost of updating an in-game counter with GlyphLabel: set_number() against
+formatting a string and going through set_text(), and how many tiles each
+timer tick rewrites. label.Label's own cost needs the real displayio, so it
+can only be measured on the board.
+"""
+
+import hostenv
+from hostenv import best_ns
+from glyph_text import GlyphLabel
+
+PREFIX = "TIME: "
+
+
+def main():
+    label = GlyphLabel(f"{PREFIX}40", x=0, y=10, width=9)
+    start = len(PREFIX)
+    
+    n = [0]
+    
+    def by_number():
+        n[0] = (n[0] + 1) % 100
+        label.set_number(n[0], start)
+    
+    def by_text():
+        n[0] = (n[0] + 1) % 100
+        label.set_text(f"{PREFIX}{n[0]}")
+    
+    print("set_number()        %5.0f ns/call" % best_ns(by_number))
+    print("f-string set_text() %5.0f ns/call" % best_ns(by_text))
+    
+    # count tile writes over a 40 s countdown
+    grid = label._grid
+    writes = [0]
+    set_tile = type(grid).__setitem__
+    
+    def counting_set(self, index, value):
+        writes[0] += 1
+        set_tile(self, index, value)
+    
+    type(grid).__setitem__ = counting_set
+    try:
+        label.set_number(40, start)
+        writes[0] = 0
+        worst = 0
+        for t in range(39, -1, -1):
+            before = writes[0]
+            label.set_number(t, start)
+            worst = max(worst, writes[0] - before)
+    finally:
+        type(grid).__setitem__ = set_tile
+    print(f"40 s countdown: {writes[0]} tile writes, at most {worst} per tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+One cursor physics step in the old float form against CursorPhysics' fixed
+point, whether a kick either way comes to rest at mirrored spots, and a
+tracemalloc trace of push()+update() standing in for gc.mem_free(), which
+only exists on the board.
+"""
+
+import tracemalloc
+
+import hostenv
+from hostenv import best_ns
+import physics
+from physics import CursorPhysics, FULL_TURN
+
+
+class FloatCursor:
+    """the game loop's physics before it went fixed point"""
+    
+    def __init__(self):
+        self.angle = 0.0
+        self.velocity = 0.0
+    
+    def step(self, d):
+        self.velocity += d * 2
+        self.velocity = max(-22, min(22, self.velocity))
+        self.velocity *= 0.985
+        self.angle = (self.angle + self.velocity) % 360
+
+
+def main():
+    old = FloatCursor()
+    new = CursorPhysics()
+    
+    def float_step():
+        old.step(1)
+    
+    def fixed_step():
+        new.push(1)
+        new.step()
+    
+    print("float step  %4.0f ns" % best_ns(float_step, 200_000))
+    print("fixed step  %4.0f ns" % best_ns(fixed_step, 200_000))
+    
+    # a kick each way has to die out at mirrored positions
+    ends = []
+    for kick in (5, -5):
+        c = CursorPhysics()
+        c.push(kick)
+        for _ in range(2000):
+            c.step()
+        ends.append((c.position, c.velocity))
+    (pos_cw, v_cw), (pos_ccw, v_ccw) = ends
+    print(f"+5 stops at {pos_cw} (v={v_cw}), -5 at {pos_ccw} (v={v_ccw}), mirrored: {pos_cw + pos_ccw == FULL_TURN}")
+    
+    # time steps in from a fake clock so every update() runs one step
+    now = [0]
+    physics.ticks_ms = lambda: now[0]
+    c = CursorPhysics()
+    
+    def run(n):
+        for i in range(n):
+            now[0] += 20
+            c.push(i & 1)
+            c.update()
+    
+    tracemalloc.start()
+    run(1_000)
+    after_1k = tracemalloc.get_traced_memory()[0]
+    run(100_000)
+    after_101k = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"traced memory after 1k iterations {after_1k} B, after 101k {after_101k} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Frames pushed in a simulated 60 s round at 30 fps: random encoder input,
+the timer ticking every second and a hit every 2 s. Compares what
+RefreshScheduler pushes with refreshing on every frame.
+Time is simulated, so this runs in a moment and always gives the same numbers.
+"""
+
+import random
+
+import hostenv
+import physics
+import refresh_scheduler
+from refresh_scheduler import RefreshScheduler, CURSOR, LABELS, DIAL
+from physics import CursorPhysics
+from ui_display import build_cursor, update_cursor_rotation
+from glyph_text import GlyphLabel
+import displayio
+
+SECONDS = 60
+FPS = 30
+
+_now = 0
+
+
+def fake_ticks():
+    return _now
+
+
+class FakeDisplay:
+    auto_refresh = True
+    
+    def refresh(self, minimum_frames_per_second=0):
+        return True
+
+
+def main():
+    global _now
+    random.seed(6)
+    physics.ticks_ms = fake_ticks
+    refresh_scheduler.ticks_ms = fake_ticks
+    
+    fg = displayio.Group()
+    cursor = build_cursor(fg)
+    time_label = GlyphLabel("TIME: 60", x=0, y=10, width=9)
+    hits_label = GlyphLabel("HITS: 0", x=70, y=10, width=9)
+    frames = RefreshScheduler(FakeDisplay(), FPS)
+    cursor_physics = CursorPhysics()
+    frames.start()
+    
+    hits = 0
+    for ms in range(0, SECONDS * 1000, 5):
+        _now = ms
+        
+        # rules loop, every 5 ms
+        if random.random() < 0.05:
+            cursor_physics.push(random.choice((-1, 1)))
+        else:
+            cursor_physics.push(0)
+        if ms % 1000 == 0 and time_label.set_number(SECONDS - ms // 1000, 6):
+            frames.mark(LABELS)
+        if ms % 2000 == 0 and ms:
+            hits += 1
+            if hits_label.set_number(hits, 6):
+                frames.mark(LABELS)
+            frames.mark(DIAL)
+        
+        # physics at its own step, rendering at the frame rate
+        cursor_physics.update()
+        if ms % (1000 // FPS) < 5:
+            if update_cursor_rotation(cursor, cursor_physics.angle):
+                frames.mark(CURSOR)
+            frames.refresh()
+    
+    pushed = frames.frames_pushed
+    print(f"{SECONDS} s at {FPS} fps: {pushed} frames pushed, {frames.frames_skipped} skipped")
+    print(f"refreshing every frame would push {SECONDS * FPS} ({SECONDS * FPS / max(pushed, 1):.1f}x more)")
+
+
+if __name__ == "__main__":
+    main()
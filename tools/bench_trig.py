@@ -0,0 +1,35 @@
+"""
+Per-call cost of polar() with float trig (the old ui_display version) against
+the integer table in trig.py, and how many dial points move because of rounding.
+"""
+
+import math
+
+import hostenv
+from hostenv import best_ns
+from trig import polar
+
+
+def float_polar(cx, cy, r, a):
+    rad = math.radians(a)
+    return int(cx + r * math.cos(rad)), int(cy + r * math.sin(rad))
+
+
+def main():
+    print("float polar()  %4.0f ns/call" % best_ns(lambda: float_polar(64, 32, 28, 137), 200_000))
+    print("table polar()  %4.0f ns/call" % best_ns(lambda: polar(64, 32, 28, 137), 200_000))
+    
+    # every whole degree at the radii the dial, splash and stun screens use
+    points = moved = worst = 0
+    for r in range(4, 32):
+        for a in range(360):
+            (x, y), (fx, fy) = polar(64, 32, r, a), float_polar(64, 32, r, a)
+            points += 1
+            if (x, y) != (fx, fy):
+                moved += 1
+                worst = max(worst, abs(x - fx), abs(y - fy))
+    print(f"{moved} of {points} points differ from the float version, by at most {worst} px")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+# host tests import the controller code and the CircuitPython stand-ins through this
+import hostenv  # noqa: F401
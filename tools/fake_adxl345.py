@@ -0,0 +1,115 @@
+"""
+Register-level ADXL345 on a fake I2C bus, for host tests of accel_fifo.
+Pass it where a busio.I2C goes. It keeps a 64 byte register file, a stream
+mode FIFO and INT_SOURCE, and logs every transaction.
+
+Like the real chip, reading the data registers pops one FIFO entry, and a
+longer read carries on into the following registers rather than the next
+entry. The FIFO holds 32 entries plus one in the data registers, and
+switching FIFO_CTL to bypass mode empties it.
+"""
+
+ADDRESS = 0x53
+
+DEVID = 0x00
+INT_ENABLE = 0x2E
+INT_SOURCE = 0x30
+DATAX0 = 0x32
+FIFO_CTL = 0x38
+FIFO_STATUS = 0x39
+
+SINGLE_TAP = 0x40
+DOUBLE_TAP = 0x20
+
+DEPTH = 33
+
+
+class FakeADXL345:
+    def __init__(self, address=ADDRESS):
+        self.address = address
+        self.regs = bytearray(64)
+        self.regs[DEVID] = 0xE5
+        self.fifo = []
+        self.locked = False
+        self.transactions = 0
+        self.writes = []       # (register, value) for every register write
+        self._pointer = 0
+        self._int_source = 0
+    
+    # sensor side
+    
+    def push(self, x, y, z):
+        """add a sample, stream mode drops the oldest once the FIFO is full"""
+        self.fifo.append((x, y, z))
+        if len(self.fifo) > DEPTH:
+            del self.fifo[0]
+    
+    def tap(self, double=False):
+        """latch a tap in INT_SOURCE if that interrupt is enabled"""
+        bits = SINGLE_TAP | (DOUBLE_TAP if double else 0)
+        self._int_source |= bits & self.regs[INT_ENABLE]
+    
+    # busio.I2C side
+    
+    def try_lock(self):
+        if self.locked:
+            return False
+        self.locked = True
+        return True
+    
+    def unlock(self):
+        self.locked = False
+    
+    def _check(self, address):
+        if not self.locked:
+            raise RuntimeError("bus not locked")
+        if address != self.address:
+            raise OSError(19, "No such device")
+    
+    def writeto(self, address, buffer, *, start=0, end=None):
+        self._check(address)
+        self.transactions += 1
+        data = bytes(buffer[start:end])
+        self._pointer = data[0]
+        for i, value in enumerate(data[1:]):
+            reg = data[0] + i
+            self.regs[reg] = value
+            self.writes.append((reg, value))
+            if reg == FIFO_CTL and not value & 0xC0:
+                # bypass mode empties the FIFO
+                self.fifo = []
+    
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        self._check(address)
+        self.transactions += 1
+        self._read(buffer, start, len(buffer) if end is None else end)
+    
+    def writeto_then_readfrom(self, address, out_buffer, in_buffer, *, out_start=0, out_end=None, in_start=0, in_end=None):
+        self._check(address)
+        self.transactions += 1
+        self._pointer = out_buffer[out_start]
+        self._read(in_buffer, in_start, len(in_buffer) if in_end is None else in_end)
+    
+    def _read(self, buffer, start, end):
+        popped = False
+        for i in range(start, end):
+            reg = self._pointer
+            buffer[i] = self._register(reg)
+            if DATAX0 <= reg < DATAX0 + 6:
+                popped = True
+            self._pointer = (reg + 1) & 0x3F
+        if popped and self.fifo:
+            del self.fifo[0]
+    
+    def _register(self, reg):
+        if reg == FIFO_STATUS:
+            return len(self.fifo)
+        if reg == INT_SOURCE:
+            value = self._int_source
+            self._int_source = 0
+            return value
+        if DATAX0 <= reg < DATAX0 + 6:
+            sample = self.fifo[0] if self.fifo else (0, 0, 0)
+            word = sample[(reg - DATAX0) // 2] & 0xFFFF
+            return word >> 8 if (reg - DATAX0) & 1 else word & 0xFF
+        return self.regs[reg]
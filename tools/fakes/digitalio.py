@@ -0,0 +1,45 @@
+"""
+host stand-in for digitalio. Input levels come from the levels dict, keyed by
+pin, and pins float high when unset. Like the real thing a pin can only have
+one DigitalInOut at a time until it's deinit()ed.
+"""
+
+levels = {}
+_claimed = set()
+
+
+class Pull:
+    UP = 1
+    DOWN = 2
+
+
+class Direction:
+    INPUT = 0
+    OUTPUT = 1
+
+
+def in_use(pin):
+    """True while a DigitalInOut holds pin"""
+    return pin in _claimed
+
+
+class DigitalInOut:
+    def __init__(self, pin):
+        if pin in _claimed:
+            raise ValueError(f"{pin} in use")
+        _claimed.add(pin)
+        self._pin = pin
+        self.pull = None
+    
+    def switch_to_input(self, pull=None):
+        self.pull = pull
+    
+    @property
+    def value(self):
+        if self._pin is None:
+            raise ValueError("Object has been deinitialized and can no longer be used.")
+        return levels.get(self._pin, True)
+    
+    def deinit(self):
+        _claimed.discard(self._pin)
+        self._pin = None
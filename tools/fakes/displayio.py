@@ -0,0 +1,60 @@
+"""host stand-in for displayio: plain containers, nothing is drawn"""
+
+
+class Bitmap:
+    def __init__(self, width, height, value_count):
+        self.width = width
+        self.height = height
+        self._data = bytearray(width * height)
+    
+    def __getitem__(self, key):
+        x, y = key
+        return self._data[y * self.width + x]
+    
+    def __setitem__(self, key, value):
+        x, y = key
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(key)
+        self._data[y * self.width + x] = value
+    
+    def fill(self, value):
+        for i in range(len(self._data)):
+            self._data[i] = value
+
+
+class Palette(list):
+    def __init__(self, color_count):
+        super().__init__([0] * color_count)
+    
+    def make_transparent(self, index):
+        pass
+
+
+class TileGrid:
+    def __init__(self, bitmap, *, pixel_shader=None, x=0, y=0, width=1, height=1,
+                 tile_width=None, tile_height=None, default_tile=0):
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self._tiles = [default_tile] * (width * height)
+    
+    def __getitem__(self, index):
+        return self._tiles[index]
+    
+    def __setitem__(self, index, value):
+        self._tiles[index] = value
+
+
+class Group(list):
+    def __init__(self, *, x=0, y=0, scale=1):
+        super().__init__()
+        self.x = x
+        self.y = y
+        self.scale = scale
+        self.hidden = False
+
+
+def release_displays():
+    pass
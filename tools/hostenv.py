@@ -0,0 +1,25 @@
+"""
+Puts the controller code (src/Controller) and the CircuitPython stand-ins in
+tools/fakes on sys.path, so tests and benchmarks can import game modules on a
+desktop Python. Import it before anything from src/Controller.
+"""
+
+import os
+import sys
+import timeit
+
+TOOLS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TOOLS)
+CONTROLLER = os.path.join(ROOT, "src", "Controller")
+FAKES = os.path.join(TOOLS, "fakes")
+
+# appended, not prepended: the board's entry point is code.py, which would
+# otherwise shadow the standard library's code module
+for _path in (CONTROLLER, FAKES):
+    if _path not in sys.path:
+        sys.path.append(_path)
+
+
+def best_ns(fn, number=100_000, repeat=5):
+    """best of repeat runs, in ns per call"""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e9
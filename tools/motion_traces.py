@@ -0,0 +1,49 @@
+"""
+Synthetic 100 Hz accelerometer traces in ADXL345 counts (4 mg, so 1 g is 250)
+for the motion detector and gesture tools. Every trace sits flat with sensor
+noise of sigma 2 counts and adds one kind of movement on top.
+"""
+
+import math
+import random
+
+ONE_G = 250
+NOISE = 2
+
+
+def sample(kind, i, n, rng=random):
+    """sample i of an n sample trace of the given kind, as (x, y, z)"""
+    x, y, z = 0.0, 0.0, float(ONE_G)
+    if kind == "spike" and i == n // 2:
+        x += 40
+    elif kind == "fidget":
+        x += rng.gauss(0, 12)
+        y += rng.gauss(0, 12)
+    elif kind == "drift":
+        # 20 degrees over the whole trace
+        a = math.radians(20 * i / n)
+        x, z = ONE_G * math.sin(a), ONE_G * math.cos(a)
+    elif kind == "shake":
+        x = 200 * math.sin(i * 0.9)
+        y = 150 * math.cos(i * 1.3)
+    elif kind in ("tilt_right", "tilt_left"):
+        # roll over to 40 degrees at 40 degrees a second
+        a = math.radians(min(40, i * 0.4))
+        x, z = ONE_G * math.sin(a), ONE_G * math.cos(a)
+        if kind == "tilt_left":
+            x = -x
+    elif kind == "flip":
+        # turn upside down over one second
+        a = math.radians(min(180, i * 1.8))
+        y, z = ONE_G * math.sin(a), ONE_G * math.cos(a)
+    return (
+        int(x + rng.gauss(0, NOISE)),
+        int(y + rng.gauss(0, NOISE)),
+        int(z + rng.gauss(0, NOISE)),
+    )
+
+
+def trace(kind, seconds=3, hz=100, rng=random):
+    """a whole trace as a list of (x, y, z)"""
+    n = int(seconds * hz)
+    return [sample(kind, i, n, rng) for i in range(n)]
@@ -0,0 +1,72 @@
+"""
+Synthetic quadrature for RotaryEncoder: turns the knob at a fixed edge rate
+while update() is called every loop_ms of simulated time, and reports how many
+detents the polling decoder lost. Time is simulated in microseconds, so the
+results don't depend on how fast the host is.
+    
+    python tools/quadrature.py
+"""
+
+import hostenv
+import digitalio
+import rotary_encoder
+from rotary_encoder import RotaryEncoder
+
+PIN_A = "ENC_A"
+PIN_B = "ENC_B"
+
+# clockwise gray code (A, B) starting from the resting state with pull ups,
+# matching RotaryEncoder's transition table
+CW_STATES = ((1, 1), (1, 0), (0, 0), (0, 1))
+
+_real_ticks_ms = rotary_encoder.ticks_ms
+_now_us = 0
+
+
+def _ticks_ms():
+    return _now_us // 1000
+
+
+def missed_steps(edge_rate, loop_ms, detents=1000, direction=1):
+    """turn detents clockwise (direction 1) or back (-1), returns (detents missed, illegal edges)"""
+    global _now_us
+    rotary_encoder.ticks_ms = _ticks_ms
+    try:
+        _now_us = 0
+        digitalio.levels[PIN_A] = True
+        digitalio.levels[PIN_B] = True
+        encoder = RotaryEncoder(PIN_A, PIN_B)
+        
+        edges = 4 * detents
+        edge_us = 1_000_000 / edge_rate
+        loop_us = int(loop_ms * 1000)
+        end_us = int(edges * edge_us) + 10 * loop_us
+        
+        # sample where the knob is at each loop iteration
+        _now_us = loop_us
+        while _now_us <= end_us:
+            edge = min(edges, int(_now_us / edge_us))
+            a, b = CW_STATES[(direction * edge) % 4]
+            digitalio.levels[PIN_A] = bool(a)
+            digitalio.levels[PIN_B] = bool(b)
+            encoder.update()
+            _now_us += loop_us
+        
+        position = encoder.get_position() * direction
+        encoder.suspend()
+        return detents - position, encoder.illegal_edges
+    finally:
+        rotary_encoder.ticks_ms = _real_ticks_ms
+
+
+def main():
+    print("polling decoder, 4000 edges (1000 detents) per case")
+    print("edges/s  loop ms  missed detents  illegal edges")
+    for edge_rate in (250, 500, 1000, 2000):
+        for loop_ms in (0.2, 1, 3):
+            missed, illegal = missed_steps(edge_rate, loop_ms)
+            print(f"{edge_rate:7d}  {loop_ms:7}  {missed:14d}  {illegal:13d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import pytest
+
+from fake_adxl345 import FakeADXL345
+from accel_fifo import FifoAccelerometer, FIFO_SIZE, SINGLE_TAP, DOUBLE_TAP
+
+
+@pytest.fixture
+def chip():
+    return FakeADXL345()
+
+
+def test_setup_writes_registers_in_order(chip):
+    FifoAccelerometer(chip, rate=100)
+    # standby while configuring, measuring last
+    assert chip.writes == [(0x2D, 0x00), (0x2C, 0x0A), (0x31, 0x08), (0x38, 0x80), (0x2D, 0x08)]
+
+
+def test_rejects_unsupported_rate(chip):
+    accel = FifoAccelerometer(chip)
+    with pytest.raises(ValueError):
+        accel.set_rate(150)
+    accel.set_rate(400)
+    assert chip.regs[0x2C] == 0x0C
+
+
+def test_decodes_signed_samples(chip):
+    accel = FifoAccelerometer(chip)
+    chip.push(-1, 256, -512)
+    chip.push(32767, -32768, 0)
+    assert accel.read_block() == 2
+    assert list(accel.samples[:6]) == [-1, 256, -512, 32767, -32768, 0]
+    assert accel.count == 2
+
+
+def test_one_status_read_and_one_read_per_sample(chip):
+    accel = FifoAccelerometer(chip)
+    for i in range(10):
+        chip.push(i, -i, 250)
+    chip.transactions = 0
+    assert accel.read_block() == 10
+    assert chip.transactions == 11
+    assert chip.fifo == []
+
+
+def test_empty_fifo_reads_nothing(chip):
+    accel = FifoAccelerometer(chip)
+    chip.transactions = 0
+    assert accel.read_block() == 0
+    assert accel.count == 0
+    assert chip.transactions == 1
+
+
+def test_full_fifo_is_capped_and_counted(chip):
+    accel = FifoAccelerometer(chip)
+    for i in range(40):
+        chip.push(i, 0, 0)
+    assert accel.read_block() == FIFO_SIZE
+    assert accel.full_blocks == 1
+    # stream mode kept the newest 33, the block took the oldest 32 of those
+    assert accel.samples[0] == 7
+    assert accel.samples[3 * (FIFO_SIZE - 1)] == 38
+    assert len(chip.fifo) == 1
+
+
+def test_clear_empties_the_fifo_in_two_writes(chip):
+    accel = FifoAccelerometer(chip)
+    for i in range(20):
+        chip.push(i, 0, 0)
+    chip.transactions = 0
+    accel.clear()
+    assert chip.transactions == 2
+    assert chip.regs[0x38] == 0x80
+    assert accel.read_block() == 0
+
+
+def test_taps_latch_until_read(chip):
+    accel = FifoAccelerometer(chip)
+    chip.tap()
+    assert accel.interrupt_source() == 0   # not enabled yet
+    
+    accel.enable_taps()
+    assert accel.taps_enabled
+    assert chip.regs[0x2A] == 0x07
+    assert chip.regs[0x2E] == SINGLE_TAP | DOUBLE_TAP
+    assert chip.regs[0x1D] == 48           # 3 g at 62.5 mg per LSB
+    
+    chip.tap(double=True)
+    assert accel.interrupt_source() == SINGLE_TAP | DOUBLE_TAP
+    assert accel.interrupt_source() == 0
@@ -0,0 +1,115 @@
+import types
+
+import pytest
+
+import digitalio
+import idle
+from idle import IdleSleeper
+from rotary_encoder import RotaryEncoder
+from button import DebouncedButton
+
+WAKE_PINS = ("ENC_A", "ENC_B", "BTN")
+
+
+class PinAlarm:
+    def __init__(self, pin, *, value, pull):
+        self.pin = pin
+        self.value = value
+        self.pull = pull
+
+
+class FakeAlarm:
+    """stand-in for the alarm module, the sleep presses the button"""
+    
+    def __init__(self):
+        self.pin = types.SimpleNamespace(PinAlarm=PinAlarm)
+        self.calls = []
+    
+    def light_sleep_until_alarms(self, *alarms):
+        self.calls.append({
+            "alarms": {a.pin: a.value for a in alarms},
+            "pulls": {a.pin: a.pull for a in alarms},
+            "pins_free": not any(digitalio.in_use(a.pin) for a in alarms),
+        })
+        digitalio.levels["BTN"] = False
+        return alarms[-1]
+
+
+class FakeDisplay:
+    def __init__(self):
+        self.log = []
+    
+    def sleep(self):
+        self.log.append("sleep")
+    
+    def wake(self):
+        self.log.append("wake")
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = [0]
+    monkeypatch.setattr(idle, "ticks_ms", lambda: clock[0])
+    digitalio.levels.clear()
+    yield clock
+    digitalio.levels.clear()
+
+
+@pytest.fixture
+def setup(now):
+    encoder = RotaryEncoder("ENC_A", "ENC_B")
+    button = DebouncedButton("BTN")
+    alarm = FakeAlarm()
+    sleeper = IdleSleeper(WAKE_PINS, (encoder, button), timeout_s=30, alarm_module=alarm)
+    yield sleeper, alarm, encoder, button
+    encoder.suspend()
+    button.suspend()
+
+
+def test_sleeps_once_after_the_timeout(now, setup):
+    sleeper, alarm, _, _ = setup
+    display = FakeDisplay()
+    
+    now[0] = 29_999
+    assert not sleeper.check(False, display)
+    now[0] = 30_000
+    assert sleeper.check(False, display)
+    assert not sleeper.check(False, display)
+    
+    assert sleeper.sleeps == 1
+    assert len(alarm.calls) == 1
+    assert display.log == ["sleep", "wake"]
+
+
+def test_input_restarts_the_timeout(now, setup):
+    sleeper, alarm, _, _ = setup
+    now[0] = 20_000
+    assert not sleeper.check(True)
+    now[0] = 40_000
+    assert not sleeper.check(False)
+    assert alarm.calls == []
+
+
+def test_pins_are_free_and_alarms_wait_for_a_pull_down(now, setup):
+    sleeper, alarm, _, _ = setup
+    digitalio.levels["ENC_A"] = False
+    now[0] = 30_000
+    sleeper.check(False)
+    
+    # a pull with value=False is a pull-up; ENC_A already rests low so it can't be armed
+    call = alarm.calls[0]
+    assert call["pins_free"]
+    assert call["alarms"] == {"ENC_B": False, "BTN": False}
+    assert call["pulls"] == {"ENC_B": True, "BTN": True}
+
+
+def test_waking_press_is_not_a_press(now, setup):
+    sleeper, _, _, button = setup
+    now[0] = 30_000
+    sleeper.check(False)
+    
+    # the pins are ours again and the button that woke the board reads as held
+    assert all(digitalio.in_use(pin) for pin in WAKE_PINS)
+    button.update()
+    assert button.is_down
+    assert not button.pressed
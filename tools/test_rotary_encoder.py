@@ -0,0 +1,12 @@
+from quadrature import missed_steps
+
+
+def test_slow_turns_lose_nothing_either_way():
+    assert missed_steps(250, 1, detents=200) == (0, 0)
+    assert missed_steps(250, 1, detents=200, direction=-1) == (0, 0)
+
+
+def test_loop_slower_than_edges_shows_up_as_illegal_edges():
+    missed, illegal = missed_steps(2000, 1, detents=200)
+    assert missed > 0
+    assert illegal > 0